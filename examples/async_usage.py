@@ -100,6 +100,18 @@ async def example_concurrent_search_and_ingest():
         print(f"Count: {count_result.count} events")
 
 
+def example_enable_uvloop():
+    """Example: Use uvloop for high fan-out workloads.
+
+    Requires ``pip install uvloop``.
+    """
+    from quicksearch import install_uvloop
+
+    # Must run before the event loop is started
+    install_uvloop()
+    asyncio.run(example_concurrent_ingestion())
+
+
 async def main():
     """Run all examples."""
     print("=== Async Usage Examples ===\n")
@@ -6,7 +6,12 @@ from quicksearch import QuickSearchClient, EventData, SyslogData
 
 
 def example_ingest_single_event():
-    """Example: Ingest a single event."""
+    """Example: Ingest a single event.
+
+    The client keeps its connection alive between calls (with TCP_NODELAY and
+    SO_KEEPALIVE set), so reuse one client for many events rather than
+    creating one per event.
+    """
     client = QuickSearchClient(
         base_url="http://localhost:3000",
         api_key="your-api-key-here"
@@ -26,7 +26,9 @@ from datetime import datetime
 
 from quicksearch import (
     AsyncQuickSearchClient,
+    BatchIngestOptions,
     EventData,
+    QueueFullError,
     QuickSearchClient,
     QuickSearchError,
 )
@@ -48,28 +50,38 @@ class MyAppLogger:
         self.client = QuickSearchClient(
             base_url=QUICKSEARCH_URL,
             api_key=API_KEY,
+            batch_options=BatchIngestOptions(
+                enabled=True,
+                batch_size=100,
+                flush_interval=1.0,
+            ),
         )
 
     def log_user_action(self, user_id: str, action: str, **metadata):
-        """Log a user action event."""
+        """
+        Queue a user action event without blocking on the HTTP round-trip.
+
+        Events are sent by the client's background batcher; close() flushes
+        anything still queued. Extra keyword arguments are merged into the
+        event data.
+        """
+        data = {"user_id": user_id, "action": action}
+        if metadata:
+            data.update(metadata)
+
         event = EventData(
             type="user_action",
             application=self.app_name,
             message=f"User {user_id} performed {action}",
-            data={
-                "user_id": user_id,
-                "action": action,
-                **metadata,
-            },
+            data=data,
         )
 
         try:
-            response = self.client.ingest_event(event)
-            logger.info(f"Event logged: {response.eventId}")
-            return response.eventId
-        except QuickSearchError as e:
-            logger.error(f"Failed to log event: {e}")
-            return None
+            self.client.ingest_event_batched(event)
+            return True
+        except QueueFullError as e:
+            logger.error(f"Failed to queue event: {e}")
+            return False
 
     def log_error(self, error: Exception, context: dict | None = None):
         """Log an error event."""
@@ -99,35 +111,55 @@ class MyAppLogger:
         return result.events
 
     def close(self):
-        """Cleanup."""
+        """Flush queued events and release the client."""
+        self.client.flush_batch()
         self.client.close()
 
 
 class AsyncMyAppLogger:
-    """Async version for high-throughput logging."""
+    """Async version for high-throughput logging.
 
-    def __init__(self, app_name: str):
+    A single AsyncQuickSearchClient is kept for the lifetime of the logger so
+    every call reuses the same HTTP connection pool instead of reconnecting.
+    """
+
+    def __init__(self, app_name: str, client: AsyncQuickSearchClient | None = None):
         self.app_name = app_name
+        self._client = client
+
+    async def _get_client(self) -> AsyncQuickSearchClient:
+        """Create and connect the shared client on first use."""
+        if self._client is None:
+            self._client = AsyncQuickSearchClient(
+                base_url=QUICKSEARCH_URL,
+                api_key=API_KEY,
+            )
+        await self._client.connect()
+        return self._client
 
     async def log_batch_events(self, events: list[dict]):
         """Log multiple events concurrently."""
-        async with AsyncQuickSearchClient(
-            base_url=QUICKSEARCH_URL,
-            api_key=API_KEY,
-        ) as client:
-            event_objects = [
-                EventData(
-                    type=e["type"],
-                    application=self.app_name,
-                    message=e.get("message"),
-                    data=e.get("data", {}),
-                )
-                for e in events
-            ]
-
-            responses = await client.ingest_events(event_objects)
-            logger.info(f"Batch logged {len(responses)} events")
-            return [r.eventId for r in responses if r.success]
+        # Build the models first; this is pure CPU work and needs no connection
+        event_objects = [
+            EventData(
+                type=e["type"],
+                application=self.app_name,
+                message=e.get("message"),
+                data=e.get("data", {}),
+            )
+            for e in events
+        ]
+
+        client = await self._get_client()
+        responses = await client.ingest_events(event_objects)
+        logger.info(f"Batch logged {len(responses)} events")
+        return [r.eventId for r in responses if r.success]
+
+    async def aclose(self):
+        """Close the shared client."""
+        if self._client is not None:
+            await self._client.close()
+            self._client = None
 
 
 # ============================================================
@@ -163,9 +195,12 @@ async def example_async_usage():
         {"type": "form_submit", "data": {"form": "contact", "success": True}},
     ]
 
-    # Log all at once
-    event_ids = await logger.log_batch_events(events)
-    logger.info(f"Logged {len(event_ids)} events concurrently")
+    try:
+        # Log all at once; later calls reuse the same connection pool
+        event_ids = await logger.log_batch_events(events)
+        logger.info(f"Logged {len(event_ids)} events concurrently")
+    finally:
+        await logger.aclose()
 
 
 def example_with_context_manager():
@@ -5,24 +5,26 @@ A Python library for interacting with the QuickSearch event log storage system.
 """
 
 from quicksearch._version import __version__
-from quicksearch.async_batch_processor import QueueFullError
 from quicksearch.async_client import AsyncQuickSearchClient
 from quicksearch.client import BaseQuickSearchClient
 from quicksearch.exceptions import (
     AuthenticationError,
     ConnectionError,
     PermissionError,
+    QueueFullError,
     QuickSearchError,
     RateLimitError,
     ServerError,
     ValidationError,
 )
+from quicksearch.loop import install_uvloop
 from quicksearch.models import (
     BatchIngestError,
     BatchIngestOptions,
     BatchIngestResult,
     Event,
     EventData,
+    EventDataFast,
     EventResponse,
     EventSearchResult,
     SyslogData,
@@ -38,6 +40,7 @@ __all__ = [
     "AsyncQuickSearchClient",
     # Models
     "EventData",
+    "EventDataFast",
     "SyslogData",
     "EventResponse",
     "EventSearchResult",
@@ -55,6 +58,8 @@ __all__ = [
     "ServerError",
     "ConnectionError",
     "QueueFullError",
+    # Event loop
+    "install_uvloop",
 ]
 
 __author__ = "QuickSearch Team"
@@ -0,0 +1,74 @@
+"""
+Adaptive batch sizing shared by the sync and async batch processors.
+"""
+
+import time
+
+from quicksearch.models import BatchIngestOptions
+
+
+class AdaptiveBatchSizer:
+    """
+    Picks the size-based flush threshold from observed arrival rate and flush latency.
+
+    With arrival rate ω (events/s) and flush latency ξ (s), the first event of a
+    batch of m waits roughly ``(m - 1) / ω + ξ`` before it is sent. Keeping that
+    under the ``flush_interval`` budget β gives ``m <= 1 + ω * (β - ξ)``, clamped
+    to ``[1, batch_size]``: low rates flush small batches early, high rates grow
+    towards ``batch_size``. Both inputs are smoothed with an EWMA. If flushes
+    alone take longer than β, full batches are used to maximize throughput.
+
+    When ``adaptive_batching`` is off, ``batch_size`` stays at the configured value.
+
+    ``flush_wait`` is the timer wait between flushes. It drops to
+    ``min_flush_interval`` after a full batch, returns to ``flush_interval`` after a
+    partial one, and doubles up to ``max_flush_interval`` on each idle wake-up.
+    Without those bounds it stays at ``flush_interval``.
+    """
+
+    def __init__(self, options: BatchIngestOptions, alpha: float = 0.2) -> None:
+        self._max_size = options.batch_size
+        self._budget = options.flush_interval
+        self._enabled = options.adaptive_batching
+        self._alpha = alpha
+        self._rate: float | None = None
+        self._latency: float | None = None
+        self._last_flush = time.monotonic()
+        self.batch_size = options.batch_size
+        self._min_wait = options.min_flush_interval or options.flush_interval
+        self._max_wait = max(self._min_wait, options.max_flush_interval or options.flush_interval)
+        self._base_wait = min(max(options.flush_interval, self._min_wait), self._max_wait)
+        self.flush_wait = self._base_wait
+
+    def record_flush(self, count: int, elapsed: float) -> None:
+        """Record a flush of ``count`` events that took ``elapsed`` seconds to send."""
+        now = time.monotonic()
+        window = now - self._last_flush
+        self._last_flush = now
+        # Compare against the threshold that triggered this flush
+        self.flush_wait = self._min_wait if count >= self.batch_size else self._base_wait
+        if not self._enabled or window <= 0:
+            return
+
+        self._rate = self._smooth(self._rate, count / window)
+        self._latency = self._smooth(self._latency, elapsed)
+
+        headroom = self._budget - self._latency
+        if headroom <= 0:
+            # The latency budget cannot be met; favour throughput instead
+            self.batch_size = self._max_size
+            return
+        self.batch_size = max(1, min(self._max_size, 1 + int(self._rate * headroom)))
+
+    def record_idle(self) -> None:
+        """Record a timer wake-up that found nothing to flush."""
+        self.flush_wait = min(self._max_wait, self.flush_wait * 2)
+
+    def reset_wait(self) -> None:
+        """Return the timer wait to ``flush_interval``."""
+        self.flush_wait = self._base_wait
+
+    def _smooth(self, current: float | None, sample: float) -> float:
+        if current is None:
+            return sample
+        return current + self._alpha * (sample - current)
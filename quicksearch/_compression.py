@@ -0,0 +1,40 @@
+"""
+Request body compression for bulk ingestion.
+
+gzip uses the standard library; zstd needs the optional ``zstandard`` package
+(``pip install quicksearch-python-sdk[zstd]``).
+"""
+
+import gzip
+
+try:
+    import zstandard  # type: ignore[import-not-found]
+except ImportError:  # pragma: no cover - optional dependency
+    zstandard = None  # type: ignore[assignment]
+
+# Bodies smaller than this are sent as-is; compressing them saves too little
+COMPRESSION_MIN_BYTES = 16 * 1024
+
+
+def compress(body: bytes, method: str) -> tuple[bytes, str | None]:
+    """
+    Compress a request body with the given method.
+
+    Returns:
+        The body to send and the Content-Encoding to set, or ``None`` if the
+        body was left uncompressed
+
+    Raises:
+        ImportError: If zstd is requested but zstandard is not installed
+    """
+    if method == "none" or len(body) < COMPRESSION_MIN_BYTES:
+        return body, None
+    if method == "gzip":
+        return gzip.compress(body, compresslevel=6), "gzip"
+    if method == "zstd":
+        if zstandard is None:
+            raise ImportError(
+                "zstandard is not installed. Install it with: pip install 'quicksearch-python-sdk[zstd]'"
+            )
+        return zstandard.ZstdCompressor(level=3).compress(body), "zstd"
+    raise ValueError(f"Unsupported compression method: {method}")
@@ -0,0 +1,89 @@
+"""
+JSON encoding helpers shared by the sync and async clients.
+
+Request bodies are encoded straight to ``bytes`` with pydantic-core's Rust
+serializer instead of going through ``json.dumps`` inside httpx, and response
+bodies are parsed the same way instead of with ``response.json()``. Plain
+objects use orjson when it is installed (``pip install quicksearch-python-sdk[performance]``).
+"""
+
+from collections.abc import AsyncIterator, Iterable, Iterator
+from typing import Any
+
+from pydantic import BaseModel
+from pydantic_core import from_json, to_json
+
+from quicksearch.models import EventDataFast
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore[assignment]
+
+JSON_CONTENT_TYPE = "application/json"
+
+# Size of the pieces yielded when streaming a JSON array body
+STREAM_CHUNK_SIZE = 64 * 1024
+
+
+def dumps(obj: Any) -> bytes:
+    """
+    Serialize a model or plain Python object to compact JSON bytes.
+
+    Models are dumped with ``exclude_none=True`` to match what the API expects.
+    """
+    if isinstance(obj, EventDataFast):
+        return dumps(obj.model_dump())
+    if isinstance(obj, BaseModel):
+        return obj.__pydantic_serializer__.to_json(obj, exclude_none=True)
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            # Types orjson does not know about; pydantic-core handles a wider set
+            pass
+    return to_json(obj)
+
+
+def loads(data: bytes | str) -> Any:
+    """Parse a JSON response body, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return from_json(data)
+
+
+def dumps_many(items: Iterable[Any]) -> bytes:
+    """Serialize several models or objects into a single JSON array body."""
+    return b"[" + b",".join(dumps(item) for item in items) + b"]"
+
+
+def iter_many(items: Iterable[Any], chunk_size: int = STREAM_CHUNK_SIZE) -> Iterator[bytes]:
+    """
+    Yield the same JSON array as ``dumps_many`` in pieces of roughly ``chunk_size`` bytes.
+
+    Passing the iterator as a request body lets httpx send it with chunked
+    transfer encoding, so the whole array is never held in memory at once.
+    """
+    parts: list[bytes] = [b"["]
+    size = 1
+    for index, item in enumerate(items):
+        if index:
+            parts.append(b",")
+            size += 1
+        encoded = dumps(item)
+        parts.append(encoded)
+        size += len(encoded)
+        if size >= chunk_size:
+            yield b"".join(parts)
+            parts = []
+            size = 0
+    parts.append(b"]")
+    yield b"".join(parts)
+
+
+async def aiter_many(
+    items: Iterable[Any], chunk_size: int = STREAM_CHUNK_SIZE
+) -> AsyncIterator[bytes]:
+    """Async counterpart of ``iter_many`` for ``httpx.AsyncClient`` request bodies."""
+    for chunk in iter_many(items, chunk_size):
+        yield chunk
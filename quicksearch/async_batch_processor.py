@@ -3,9 +3,12 @@ Batch processing utilities for asynchronous client.
 """
 
 import asyncio
+import time
 from typing import Any, Callable
 
-from quicksearch.models import BatchIngestOptions, EventData
+from quicksearch._batch_sizing import AdaptiveBatchSizer
+from quicksearch.exceptions import QueueFullError
+from quicksearch.models import BatchIngestOptions, EventData, EventDataFast
 
 
 class AsyncBatchProcessor:
@@ -13,7 +16,7 @@ class AsyncBatchProcessor:
     Async batch processor for asynchronous event ingestion.
 
     Features:
-    - Async-safe event buffering
+    - Lock-free event buffering on the event loop
     - Automatic periodic flushing
     - Size-based flushing
     - Graceful shutdown with final flush
@@ -21,7 +24,7 @@ class AsyncBatchProcessor:
 
     def __init__(
         self,
-        ingest_func: Callable[[list[EventData]], Any],
+        ingest_func: Callable[[list[EventData | EventDataFast]], Any],
         options: BatchIngestOptions,
     ) -> None:
         """
@@ -33,9 +36,13 @@ class AsyncBatchProcessor:
         """
         self._ingest_func = ingest_func
         self._options = options
-        self._buffer: list[EventData] = []
-        self._lock = asyncio.Lock()
+        # Size-based flush threshold; equals options.batch_size unless adaptive
+        self._sizer = AdaptiveBatchSizer(options)
+        # Only touched from the event loop thread, and never across an await,
+        # so no lock is needed
+        self._buffer: list[EventData | EventDataFast] = []
         self._flush_task: asyncio.Task[None] | None = None
+        self._flush_event = asyncio.Event()
         self._stop_event = asyncio.Event()
 
     async def start(self) -> None:
@@ -51,6 +58,7 @@ class AsyncBatchProcessor:
         This method waits until all queued events are processed.
         """
         self._stop_event.set()
+        self._flush_event.set()  # Wake up the flush task
 
         if self._flush_task and not self._flush_task.done():
             await asyncio.wait_for(self._flush_task, timeout=30.0)
@@ -58,7 +66,7 @@ class AsyncBatchProcessor:
         # Final flush
         await self._flush_remaining()
 
-    async def add_event(self, event: EventData) -> None:
+    async def add_event(self, event: EventData | EventDataFast) -> None:
         """
         Add an event to the batch buffer.
 
@@ -68,66 +76,80 @@ class AsyncBatchProcessor:
         Raises:
             QueueFullError: If buffer exceeds queue_size_limit
         """
-        async with self._lock:
-            if len(self._buffer) >= self._options.queue_size_limit:
-                raise QueueFullError(
-                    f"Batch buffer full ({self._options.queue_size_limit} events)"
-                )
+        if len(self._buffer) >= self._options.queue_size_limit:
+            raise QueueFullError(
+                f"Batch buffer full ({self._options.queue_size_limit} events)"
+            )
 
-            self._buffer.append(event)
+        self._buffer.append(event)
+
+        # Trigger flush if batch size reached
+        if len(self._buffer) >= self._sizer.batch_size:
+            self._flush_event.set()
 
     async def force_flush(self) -> None:
         """Force an immediate flush of all buffered events."""
-        await self._flush_batch()
+        self._sizer.reset_wait()
+        while self._buffer:
+            await self._flush_batch()
 
     async def _flush_loop(self) -> None:
         """Background task that periodically flushes events."""
-        while not self._stop_event.is_set():
-            try:
-                # Wait for flush interval or stop event
-                await asyncio.wait_for(
-                    self._stop_event.wait(),
-                    timeout=self._options.flush_interval,
-                )
+        # One waiter is reused across interval timeouts and only replaced once
+        # the event fires, so a quiet interval costs no exception or new task
+        waiter: asyncio.Task[Any] | None = None
+        try:
+            while not self._stop_event.is_set():
+                if waiter is None:
+                    waiter = asyncio.create_task(self._flush_event.wait())
+
+                # Wait for flush interval, a full batch, or stop
+                done, _ = await asyncio.wait({waiter}, timeout=self._sizer.flush_wait)
+                if done:
+                    waiter = None
+                self._flush_event.clear()
 
                 if self._stop_event.is_set():
                     break
-            except asyncio.TimeoutError:
-                pass  # Normal timeout, continue to flush
 
-            await self._flush_batch()
+                await self._flush_batch()
+        finally:
+            if waiter is not None:
+                waiter.cancel()
 
     async def _flush_batch(self) -> None:
         """Flush a batch of events from the buffer."""
-        async with self._lock:
-            if not self._buffer:
-                return
-
-            # Atomic swap to get current buffer
-            batch = self._buffer.copy()
-            self._buffer.clear()
+        if not self._buffer:
+            self._sizer.record_idle()
+            return
+
+        # Take up to batch_size events; no await separates the read from the reset
+        size = self._options.batch_size
+        if len(self._buffer) <= size:
+            batch, self._buffer = self._buffer, []
+        else:
+            batch = self._buffer[:size]
+            del self._buffer[:size]
+
+        # More full batches are waiting; flush again without waiting for the interval
+        if len(self._buffer) >= self._sizer.batch_size:
+            self._flush_event.set()
 
         if batch:
+            started = time.monotonic()
             try:
                 await self._ingest_func(batch)
             except Exception:  # noqa: BLE001
                 # Log error but continue
                 pass
+            self._sizer.record_flush(len(batch), time.monotonic() - started)
 
     async def _flush_remaining(self) -> None:
         """Flush all remaining events during shutdown."""
-        async with self._lock:
-            batch = self._buffer.copy()
-            self._buffer.clear()
+        batch, self._buffer = self._buffer, []
 
         if batch:
             try:
                 await self._ingest_func(batch)
             except Exception:  # noqa: BLE001
                 pass
-
-
-class QueueFullError(Exception):
-    """Raised when batch buffer is full."""
-
-    pass
@@ -4,23 +4,101 @@ Asynchronous client for QuickSearch API using httpx.
 
 import asyncio
 import time
-from typing import Any, Union
+from collections.abc import AsyncIterator, Awaitable, Iterable, Mapping, Sequence
+from typing import Any, Callable, TypeVar, Union
 
 import httpx
 
-from quicksearch.async_batch_processor import AsyncBatchProcessor, QueueFullError
-from quicksearch.client import BaseQuickSearchClient
+from quicksearch import _compression, _json
+from quicksearch.async_batch_processor import AsyncBatchProcessor
+from quicksearch.client import (
+    EVENTS_PATH,
+    SOCKET_OPTIONS,
+    STREAM_BULK_MIN_EVENTS,
+    SYSLOG_PATH,
+    BaseQuickSearchClient,
+    ErrorCollector,
+    env_proxy_configured,
+    keepalive_expiry,
+    retry_after_exceeds_schedule,
+    retry_backoff,
+)
 from quicksearch.exceptions import ConnectionError as QuickSearchConnectionError
+from quicksearch.exceptions import QueueFullError
 from quicksearch.models import (
     BatchIngestError,
     BatchIngestOptions,
     BatchIngestResult,
     EventData,
+    EventDataFast,
     EventResponse,
     EventSearchResult,
     SyslogData,
 )
 
+T = TypeVar("T")
+R = TypeVar("R")
+
+# Bulk chunks in flight per unit of peak_concurrency over an HTTP/2 connection
+HTTP2_CHUNK_MULTIPLIER = 4
+
+# An event as it travels through the batch paths; dicts appear when validate=False
+_Event = Union[EventData, EventDataFast, dict[str, Any]]
+
+
+def _event_dict(event: _Event) -> dict[str, Any]:
+    """Return an event as a plain dict for error reporting."""
+    return event if isinstance(event, dict) else event.model_dump()
+
+
+async def _for_each_bounded(
+    func: Callable[[int, T], Awaitable[Any]],
+    items: Iterable[T],
+    limit: int,
+) -> None:
+    """
+    Await ``func(index, item)`` for every item with at most ``limit`` calls in flight.
+
+    ``limit`` long-lived workers pull from one shared iterator, so no task is
+    created per item and large inputs are never materialized. The first
+    failure cancels the remaining work before it propagates. Return values
+    are discarded.
+    """
+    iterator = enumerate(items)
+
+    async def worker() -> None:
+        # next() on the shared iterator never awaits, so workers cannot
+        # receive the same item
+        for index, item in iterator:
+            await func(index, item)
+
+    workers = [asyncio.create_task(worker()) for _ in range(limit)]
+    try:
+        await asyncio.wait(workers, return_when=asyncio.FIRST_EXCEPTION)
+    finally:
+        for task in workers:
+            task.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+
+    for task in workers:
+        if not task.cancelled() and task.exception() is not None:
+            raise task.exception()  # type: ignore[misc]
+
+
+async def _gather_bounded(
+    func: Callable[[int, T], Awaitable[R]],
+    items: Sequence[T],
+    limit: int,
+) -> list[R]:
+    """Like ``_for_each_bounded``, but return the results in input order."""
+    results: list[Any] = [None] * len(items)
+
+    async def collect(index: int, item: T) -> None:
+        results[index] = await func(index, item)
+
+    await _for_each_bounded(collect, items, limit)
+    return results
+
 
 class AsyncQuickSearchClient(BaseQuickSearchClient):
     """Asynchronous client for QuickSearch API."""
@@ -34,15 +112,41 @@ class AsyncQuickSearchClient(BaseQuickSearchClient):
         verify_ssl: bool = True,
         limits: httpx.Limits | None = None,
         batch_options: BatchIngestOptions | None = None,
+        http2: bool = False,
+        bulk_ingest_path: str | None = None,
+        validate_responses: bool = False,
+        warm_up: bool = False,
     ) -> None:
-        super().__init__(base_url, api_key, jwt_token, timeout, verify_ssl)
-        self.limits = limits or httpx.Limits(max_keepalive_connections=5, max_connections=10)
+        super().__init__(
+            base_url,
+            api_key,
+            jwt_token,
+            timeout,
+            verify_ssl,
+            bulk_ingest_path=bulk_ingest_path,
+            validate_responses=validate_responses,
+        )
+        # HTTP/2 multiplexes concurrent requests over one connection (requires `h2`)
+        self.http2 = http2
+        # Open a pooled connection in connect() so the first ingest skips the handshake
+        self.warm_up = warm_up
         self._client: httpx.AsyncClient | None = None
 
         # Batch processing support
         self._batch_options = batch_options or BatchIngestOptions()
         self._batch_processor: AsyncBatchProcessor | None = None
 
+        # Keep max_concurrency connections alive; extra burst connections are
+        # opened under load and closed again once idle. Over HTTP/2 a single
+        # multiplexed connection carries all requests, so only one is kept; the
+        # connection cap stays for servers that negotiate HTTP/1.1 instead. Idle
+        # connections outlive the flush interval so each flush reuses them.
+        self.limits = limits or httpx.Limits(
+            max_keepalive_connections=1 if http2 else max(5, self._batch_options.max_concurrency),
+            max_connections=max(10, self._batch_options.peak_concurrency),
+            keepalive_expiry=keepalive_expiry(self._batch_options),
+        )
+
     async def __aenter__(self) -> "AsyncQuickSearchClient":
         await self.connect()
         return self
@@ -53,12 +157,28 @@ class AsyncQuickSearchClient(BaseQuickSearchClient):
     async def connect(self) -> None:
         """Initialize the async client."""
         if self._client is None:
-            self._client = httpx.AsyncClient(
-                base_url=self.base_url,
-                timeout=self.timeout,
-                verify=self.verify_ssl,
-                limits=self.limits,
-            )
+            if env_proxy_configured():
+                self._client = httpx.AsyncClient(
+                    base_url=self.base_url,
+                    timeout=self.timeout,
+                    verify=self.verify_ssl,
+                    limits=self.limits,
+                    http2=self.http2,
+                )
+            else:
+                transport = httpx.AsyncHTTPTransport(
+                    verify=self.verify_ssl,
+                    limits=self.limits,
+                    http2=self.http2,
+                    socket_options=SOCKET_OPTIONS,
+                )
+                self._client = httpx.AsyncClient(
+                    base_url=self.base_url,
+                    timeout=self.timeout,
+                    transport=transport,
+                )
+            if self.warm_up:
+                await self._warm_up()
 
         # Start batch processor if enabled
         if self._batch_options.enabled and self._batch_processor is None:
@@ -79,47 +199,49 @@ class AsyncQuickSearchClient(BaseQuickSearchClient):
             await self._client.aclose()
             self._client = None
 
+    async def _warm_up(self) -> None:
+        """Establish a pooled connection (TCP, TLS, ALPN) ahead of the first request."""
+        assert self._client is not None
+
+        try:
+            await self._client.head(EVENTS_PATH, headers=self._auth_headers, params=self._auth_params)
+        except httpx.HTTPError:
+            # Best effort; the first real request will connect and report errors
+            pass
+
     def _ensure_connected(self) -> None:
         """Ensure client is connected."""
         if self._client is None:
             raise RuntimeError("Client not connected. Use 'async with' or call 'connect()' first.")
 
-    async def ingest_event(self, event: EventData | dict[str, Any]) -> EventResponse:
+    async def ingest_event(
+        self,
+        event: EventData | EventDataFast | dict[str, Any],
+        validate: bool = True,
+    ) -> EventResponse:
         """
         Asynchronously ingest an event into QuickSearch.
 
         Args:
-            event: Event data as EventData model or dictionary
+            event: Event data as EventData, EventDataFast or dictionary
+            validate: Validate dictionaries as EventData before sending; pass
+                False to send a dictionary as-is
 
         Returns:
             EventResponse: Response containing success status and event ID
         """
         self._ensure_connected()
-        assert self._client is not None
 
-        if isinstance(event, dict):
+        if validate and isinstance(event, dict):
             event = EventData(**event)
 
-        headers = {"Content-Type": "application/json", **self.auth.get_headers()}
-        params = self.auth.get_query_params()
-
-        try:
-            response = await self._client.post(
-                "/api/events",
-                json=event.model_dump(exclude_none=True),
-                headers=headers,
-                params=params,
-            )
-        except httpx.RequestError as e:
-            raise QuickSearchConnectionError(f"Connection error: {e}") from e
-
-        data = self._handle_response(response.status_code, response.json())
-        return EventResponse(**data)
+        return await self._post_event(_json.dumps(event))
 
     async def ingest_events(
         self,
-        events: list[EventData | dict[str, Any]],
+        events: list[EventData | EventDataFast | dict[str, Any]],
         batch_options: BatchIngestOptions | None = None,
+        validate: bool = True,
     ) -> Union[list[EventResponse], BatchIngestResult]:
         """
         Asynchronously ingest multiple events in batch.
@@ -127,6 +249,8 @@ class AsyncQuickSearchClient(BaseQuickSearchClient):
         Args:
             events: List of event data
             batch_options: Optional batch configuration (overrides client default)
+            validate: Validate dictionaries as EventData before sending; pass
+                False to send dictionaries as-is
 
         Returns:
             List of EventResponse objects if batching disabled,
@@ -134,22 +258,49 @@ class AsyncQuickSearchClient(BaseQuickSearchClient):
         """
         self._ensure_connected()
 
-        # Convert dicts to EventData
-        event_data_list = [
-            event if isinstance(event, EventData) else EventData(**event)
-            for event in events
-        ]
-
         # Use provided options or client default
         options = batch_options or self._batch_options
 
+        if len(events) == 1 and not options.enabled:
+            # Nothing to parallelize; skip the fan-out machinery
+            return [await self.ingest_event(events[0], validate=validate)]
+
+        event_data_list: list[_Event]
+        if validate:
+            # Convert dicts to EventData; models pass through unchanged
+            event_data_list = [
+                event if isinstance(event, (EventData, EventDataFast)) else EventData(**event)
+                for event in events
+            ]
+        else:
+            event_data_list = list(events)
+
         if not options.enabled:
-            # Backward compatible: sequential ingestion
-            return [await self.ingest_event(event) for event in event_data_list]
+            # Backward compatible: one EventResponse per event, in input order
+            return await _gather_bounded(
+                lambda _, event: self.ingest_event(event, validate=False),
+                event_data_list,
+                options.peak_concurrency,
+            )
 
         # Use concurrent batch ingestion with partial success
         return await self._ingest_events_with_result(event_data_list, options)
 
+    async def ingest_events_raw(self, events: list[dict[str, Any]]) -> list[EventResponse]:
+        """
+        Asynchronously ingest pre-built event dictionaries without EventData models.
+
+        The dictionaries are serialized as-is with no client-side validation.
+
+        Args:
+            events: List of event dictionaries in the API wire format
+
+        Returns:
+            List of EventResponse objects, one per event
+        """
+        self._ensure_connected()
+        return [await self._post_event(_json.dumps(event)) for event in events]
+
     async def search_events(
         self,
         query: str | None = None,
@@ -176,37 +327,31 @@ class AsyncQuickSearchClient(BaseQuickSearchClient):
         self._ensure_connected()
         assert self._client is not None
 
-        params = {
-            "q": query,
-            "limit": limit,
-            "source": source,
-            "severity": severity,
-            "timestamp_gte": timestamp_gte,
-            **kwargs,
-        }
-        params = {k: v for k, v in params.items() if v is not None}
-
-        headers = self.auth.get_headers()
-        auth_params = self.auth.get_query_params()
+        params = self._search_params(query, limit, source, severity, timestamp_gte, kwargs)
 
         try:
             response = await self._client.get(
-                "/api/events",
-                params={**params, **auth_params},
-                headers=headers,
+                EVENTS_PATH,
+                params=params,
+                headers=self._auth_headers,
             )
         except httpx.RequestError as e:
             raise QuickSearchConnectionError(f"Connection error: {e}") from e
 
-        data = self._handle_response(response.status_code, response.json())
-        return EventSearchResult(**data)
+        return self._search_result(response)
 
-    async def ingest_syslog(self, syslog_data: SyslogData | str | dict[str, Any]) -> EventResponse:
+    async def ingest_syslog(
+        self,
+        syslog_data: SyslogData | str | dict[str, Any],
+        validate: bool = True,
+    ) -> EventResponse:
         """
         Asynchronously ingest a syslog message into QuickSearch.
 
         Args:
             syslog_data: Syslog data as SyslogData model, raw string, or dictionary
+            validate: Validate dictionaries as SyslogData before sending; pass
+                False to send a dictionary as-is
 
         Returns:
             EventResponse: Response containing success status and event ID
@@ -214,47 +359,35 @@ class AsyncQuickSearchClient(BaseQuickSearchClient):
         self._ensure_connected()
         assert self._client is not None
 
-        headers = {"Content-Type": "application/json", **self.auth.get_headers()}
-        params = self.auth.get_query_params()
+        if isinstance(syslog_data, str):
+            content: str | bytes = syslog_data
+        elif validate and isinstance(syslog_data, dict):
+            content = _json.dumps(SyslogData(**syslog_data))
+        else:
+            content = _json.dumps(syslog_data)
 
         try:
-            if isinstance(syslog_data, str):
-                response = await self._client.post(
-                    "/api/syslog",
-                    content=syslog_data,
-                    headers=headers,
-                    params=params,
-                )
-            elif isinstance(syslog_data, dict):
-                syslog = SyslogData(**syslog_data)
-                response = await self._client.post(
-                    "/api/syslog",
-                    json=syslog.model_dump(exclude_none=True),
-                    headers=headers,
-                    params=params,
-                )
-            else:
-                response = await self._client.post(
-                    "/api/syslog",
-                    json=syslog_data.model_dump(exclude_none=True),
-                    headers=headers,
-                    params=params,
-                )
+            response = await self._client.post(
+                SYSLOG_PATH,
+                content=content,
+                headers=self._json_headers,
+                params=self._auth_params,
+            )
         except httpx.RequestError as e:
             raise QuickSearchConnectionError(f"Connection error: {e}") from e
 
-        data = self._handle_response(response.status_code, response.json())
-        return EventResponse(**data)
+        return self._event_response(response)
 
     async def ingest_event_batched(
         self,
-        event: EventData | dict[str, Any],
+        event: EventData | EventDataFast | dict[str, Any],
     ) -> None:
         """
         Add a single event to the batch queue (non-blocking).
 
         The event will be sent in the next batch flush based on
-        batch_size or flush_interval triggers.
+        batch_size or flush_interval triggers. The event is encoded when
+        its batch is flushed, so changes made to it before then are sent.
 
         Args:
             event: Event data to queue
@@ -266,7 +399,7 @@ class AsyncQuickSearchClient(BaseQuickSearchClient):
         if not self._batch_processor:
             raise RuntimeError("Batching is not enabled. Set batch_options.enabled=True")
 
-        event_data = event if isinstance(event, EventData) else EventData(**event)
+        event_data = event if isinstance(event, (EventData, EventDataFast)) else EventData(**event)
         await self._batch_processor.add_event(event_data)
 
     async def flush_batch(self) -> None:
@@ -274,92 +407,269 @@ class AsyncQuickSearchClient(BaseQuickSearchClient):
         if self._batch_processor:
             await self._batch_processor.force_flush()
 
-    async def _ingest_batch_internal(self, batch: list[EventData]) -> None:
+    async def _post_event(self, body: bytes) -> EventResponse:
+        """POST an already-encoded event body to the events endpoint."""
+        assert self._client is not None
+
+        try:
+            response = await self._client.post(
+                EVENTS_PATH,
+                content=body,
+                headers=self._json_headers,
+                params=self._auth_params,
+            )
+        except httpx.RequestError as e:
+            raise QuickSearchConnectionError(f"Connection error: {e}") from e
+
+        return self._event_response(response)
+
+    async def _post_events_bulk(
+        self, batch: Sequence[_Event], options: BatchIngestOptions
+    ) -> list[EventResponse]:
+        """POST a whole batch as one JSON array, falling back to one POST per event."""
+        responses = await self._post_bulk_request(batch, options)
+        if responses is None:
+            return await _gather_bounded(
+                lambda _, event: self._post_event(_json.dumps(event)),
+                batch,
+                options.max_concurrency,
+            )
+        return responses
+
+    async def _post_bulk_request(
+        self, batch: Sequence[_Event], options: BatchIngestOptions
+    ) -> list[EventResponse] | None:
+        """POST a whole batch to the bulk endpoint; None if the server does not support it."""
+        assert self._client is not None
+        assert self.bulk_ingest_path is not None
+
+        headers: Mapping[bytes, bytes] = self._json_headers
+        content: bytes | AsyncIterator[bytes]
+        compression = options.compression
+        if compression != "none":
+            content, encoding = _compression.compress(_json.dumps_many(batch), compression)
+            if encoding:
+                headers = {**headers, b"Content-Encoding": encoding.encode("ascii")}
+        elif len(batch) >= STREAM_BULK_MIN_EVENTS:
+            content = _json.aiter_many(batch)
+        else:
+            content = _json.dumps_many(batch)
+
+        try:
+            response = await self._client.post(
+                self.bulk_ingest_path,
+                content=content,
+                headers=headers,
+                params=self._auth_params,
+            )
+        except httpx.RequestError as e:
+            raise QuickSearchConnectionError(f"Connection error: {e}") from e
+
+        if self._bulk_rejected(response.status_code):
+            return None
+
+        data = self._response_data(response)
+        return self._parse_bulk_response(data, len(batch))
+
+    async def _ingest_batch_internal(self, batch: list[EventData | EventDataFast]) -> None:
         """Internal method to ingest a batch (called by batch processor)."""
+        if self._use_bulk:
+            await self._post_events_bulk(batch, self._batch_options)
+            return
+
         for event in batch:
             await self.ingest_event(event)
 
     async def _ingest_events_with_result(
         self,
-        events: list[EventData],
+        events: list[_Event],
         options: BatchIngestOptions,
     ) -> BatchIngestResult:
         """Ingest events concurrently and return detailed result."""
-        start_time = time.time()
-        errors: list[BatchIngestError] = []
-        success_count = 0
+        if self._use_bulk:
+            return await self._ingest_events_bulk_with_result(events, options)
 
-        async def ingest_with_retry(event: EventData, index: int) -> tuple[bool, BatchIngestError | None]:
-            """Ingest with retry logic."""
-            last_error = None
+        start_ns = time.perf_counter_ns()
+        errors = ErrorCollector(options)
+        success_count = await self._ingest_each(list(enumerate(events)), options, errors)
+        processing_time_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
 
-            for attempt in range(options.retry_attempts + 1):
+        return BatchIngestResult(
+            success_count=success_count,
+            failure_count=errors.count,
+            total_count=len(events),
+            errors=errors.stored,
+            errors_truncated=errors.truncated,
+            processing_time_ms=processing_time_ms,
+        )
+
+    async def _ingest_each(
+        self,
+        items: list[tuple[int, _Event]],
+        options: BatchIngestOptions,
+        errors: ErrorCollector,
+    ) -> int:
+        """
+        POST ``(index, event)`` pairs one per request with retry.
+
+        Failures are added to ``errors`` under their index; returns the number
+        of events that succeeded.
+        """
+        success_count = 0
+
+        # Events are retried in rounds: every retryable failure from one round is
+        # re-sent together after a single shared backoff, so an outage produces
+        # one coordinated retry instead of a backoff timer per event. The backoff
+        # is jittered so many clients recovering together do not retry in lockstep.
+        # Bodies are encoded once here and re-sent as-is on every retry
+        pending = [(index, event, _json.dumps(event)) for index, event in items]
+        retryable: list[tuple[int, _Event, bytes]] = []
+
+        for attempt in range(options.retry_attempts + 1):
+            is_last_attempt = attempt == options.retry_attempts
+            retryable = []
+            # Retry-After values the server sent with this round's failures
+            waits: list[float] = []
+
+            async def ingest_once(_: int, item: tuple[int, _Event, bytes]) -> None:
+                nonlocal success_count
+                index, event, body = item
                 try:
-                    await self.ingest_event(event)
-                    return True, None
+                    await self._post_event(body)
+                    success_count += 1
                 except Exception as e:  # noqa: BLE001
                     status_code = getattr(e, "status_code", None)
+                    retry_after = getattr(e, "retry_after", None)
 
-                    # Don't retry 4xx errors except 429
+                    # Don't retry 4xx errors except 429, or sooner than Retry-After asks
                     if status_code and 400 <= status_code < 500 and status_code != 429:
-                        last_error = BatchIngestError(
+                        retry = False
+                    else:
+                        retry = not is_last_attempt and not retry_after_exceeds_schedule(
+                            options, retry_after
+                        )
+
+                    if retry:
+                        retryable.append(item)
+                        if retry_after is not None:
+                            waits.append(retry_after)
+                        return
+
+                    errors.add(
+                        BatchIngestError(
                             event_index=index,
-                            event_data=event.model_dump(),
+                            event_data=_event_dict(event),
                             error_message=str(e),
                             status_code=status_code,
-                            retried=False,
+                            retried=attempt > 0,
+                            retry_after=retry_after,
                         )
-                        break
-
-                    last_error = BatchIngestError(
-                        event_index=index,
-                        event_data=event.model_dump(),
-                        error_message=str(e),
-                        status_code=status_code,
-                        retried=attempt > 0,
                     )
 
-                    if attempt < options.retry_attempts:
-                        delay = options.retry_delay * (2**attempt)
-                        await asyncio.sleep(delay)
+            # Bursting above max_concurrency if allowed
+            await _for_each_bounded(ingest_once, pending, options.peak_concurrency)
 
-            return False, last_error
+            if not retryable:
+                break
 
-        # Process all events concurrently with semaphore
-        semaphore = asyncio.Semaphore(options.max_concurrency)
+            await asyncio.sleep(retry_backoff(options, attempt, max(waits, default=None)))
+            pending = retryable
 
-        async def process_one(event: EventData, index: int) -> tuple[bool, BatchIngestError | None]:
-            async with semaphore:
-                return await ingest_with_retry(event, index)
+        return success_count
 
-        results = await asyncio.gather(
-            *[process_one(event, i) for i, event in enumerate(events)],
-            return_exceptions=True,
-        )
+    async def _ingest_events_bulk_with_result(
+        self,
+        events: list[_Event],
+        options: BatchIngestOptions,
+    ) -> BatchIngestResult:
+        """Ingest events through the bulk endpoint, one request per batch_size chunk."""
+        start_ns = time.perf_counter_ns()
+        errors = ErrorCollector(options)
+        success_count = 0
+        chunks = [events[i : i + options.batch_size] for i in range(0, len(events), options.batch_size)]
+        # Events of chunks the bulk endpoint never accepted, sent one by one below
+        fallback: list[tuple[int, _Event]] = []
+
+        async def ingest_chunk(chunk_index: int, chunk: list[_Event]) -> None:
+            nonlocal success_count
+            offset = chunk_index * options.batch_size
+            responses: list[EventResponse] | None = None
+            last_exception: Exception | None = None
+            attempt = 0
+
+            for attempt in range(options.retry_attempts + 1):
+                # This or another chunk may have found the bulk endpoint unsupported
+                if not self._use_bulk:
+                    break
+                try:
+                    responses = await self._post_bulk_request(chunk, options)
+                    if responses is not None:
+                        break
+                except Exception as e:  # noqa: BLE001
+                    last_exception = e
+                    status_code = getattr(e, "status_code", None)
+                    retry_after = getattr(e, "retry_after", None)
+
+                    # Don't retry 4xx errors except 429, or sooner than Retry-After asks
+                    if status_code and 400 <= status_code < 500 and status_code != 429:
+                        break
+                    if retry_after_exceeds_schedule(options, retry_after):
+                        break
 
-        # Collect results
-        for result in results:
-            if isinstance(result, Exception):
-                errors.append(
-                    BatchIngestError(
-                        event_index=-1,
-                        event_data={},
-                        error_message=str(result),
+                    if attempt < options.retry_attempts:
+                        await asyncio.sleep(retry_backoff(options, attempt, retry_after))
+
+            if responses is None and not self._use_bulk:
+                fallback.extend((offset + i, event) for i, event in enumerate(chunk))
+                return
+
+            if responses is None:
+                # The whole request failed; every event in the chunk failed with it
+                for i, event in enumerate(chunk):
+                    errors.add(
+                        BatchIngestError(
+                            event_index=offset + i,
+                            event_data=_event_dict(event),
+                            error_message=str(last_exception),
+                            status_code=getattr(last_exception, "status_code", None),
+                            retried=attempt > 0,
+                            retry_after=getattr(last_exception, "retry_after", None),
+                        )
                     )
-                )
-            else:
-                success, error = result
-                if success:
+                return
+
+            for i, (event, response) in enumerate(zip(chunk, responses)):
+                if response.success:
                     success_count += 1
-                elif error:
-                    errors.append(error)
+                else:
+                    errors.add(
+                        BatchIngestError(
+                            event_index=offset + i,
+                            event_data=_event_dict(event),
+                            error_message=response.message,
+                        )
+                    )
+
+        # HTTP/2 is only negotiated over TLS (httpx has no h2c), where chunks share one
+        # multiplexed connection; widen the limit there, capped so that not every
+        # chunk body is held in memory at once
+        limit = options.peak_concurrency
+        if self.http2 and self.base_url.startswith("https://"):
+            limit *= HTTP2_CHUNK_MULTIPLIER
+        await _for_each_bounded(ingest_chunk, chunks, limit)
+
+        if fallback:
+            # Per event, with retry, so only the events that fail are re-sent
+            success_count += await self._ingest_each(fallback, options, errors)
 
-        processing_time_ms = int((time.time() - start_time) * 1000)
+        processing_time_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
 
         return BatchIngestResult(
             success_count=success_count,
-            failure_count=len(errors),
+            failure_count=errors.count,
             total_count=len(events),
-            errors=errors,
+            errors=errors.stored,
+            errors_truncated=errors.truncated,
+            batch_count=len(chunks),
             processing_time_ms=processing_time_ms,
         )
@@ -5,10 +5,11 @@ Batch processing utilities for synchronous client.
 import threading
 import time
 from collections import deque
-from queue import Empty, Queue
+from queue import Empty, Full, Queue
 from typing import Any, Callable
 
-from quicksearch.models import BatchIngestOptions, EventData
+from quicksearch._batch_sizing import AdaptiveBatchSizer
+from quicksearch.models import BatchIngestOptions, EventData, EventDataFast
 
 
 class SyncBatchProcessor:
@@ -25,7 +26,7 @@ class SyncBatchProcessor:
 
     def __init__(
         self,
-        ingest_func: Callable[[list[EventData]], list[Any]],
+        ingest_func: Callable[[list[EventData | EventDataFast]], list[Any]],
         options: BatchIngestOptions,
     ) -> None:
         """
@@ -37,12 +38,18 @@ class SyncBatchProcessor:
         """
         self._ingest_func = ingest_func
         self._options = options
-        self._queue: Queue[EventData] = Queue(maxsize=options.queue_size_limit)
+        # Size-based flush threshold; equals options.batch_size unless adaptive
+        self._sizer = AdaptiveBatchSizer(options)
+        self._queue: Queue[EventData | EventDataFast] = Queue(maxsize=options.queue_size_limit)
         self._lock = threading.RLock()
         self._flush_event = threading.Event()
+        # Held while draining so only one flush runs at a time
+        self._flush_lock = threading.Lock()
+        # Notified after each sent batch; _sending covers events taken off the queue
+        self._flushed = threading.Condition()
+        self._sending = False
         self._stop_event = threading.Event()
         self._flush_thread: threading.Thread | None = None
-        self._pending_count = 0
 
     def start(self) -> None:
         """Start the background flush thread."""
@@ -72,7 +79,7 @@ class SyncBatchProcessor:
         # Final flush of any remaining events
         self._flush_remaining()
 
-    def add_event(self, event: EventData, timeout: float = 5.0) -> bool:
+    def add_event(self, event: EventData | EventDataFast, timeout: float = 5.0) -> bool:
         """
         Add an event to the batch queue.
 
@@ -85,27 +92,48 @@ class SyncBatchProcessor:
         """
         try:
             self._queue.put(event, block=True, timeout=timeout)
-            with self._lock:
-                self._pending_count += 1
+        except Full:
+            return False
 
-            # Trigger flush if batch size reached
-            with self._lock:
-                if self._pending_count >= self._options.batch_size:
-                    self._flush_event.set()
+        # Trigger flush if batch size reached; the queue tracks its own size.
+        # is_set() is a plain read, so producers only take the Event's lock once
+        # per batch rather than on every event past the threshold.
+        if self._queue.qsize() >= self._sizer.batch_size and not self._flush_event.is_set():
+            self._flush_event.set()
 
-            return True
-        except Exception:  # noqa: BLE001
-            return False
+        return True
 
     def force_flush(self) -> None:
         """Force an immediate flush of all queued events."""
+        self._sizer.reset_wait()
         self._flush_event.set()
 
+    def wait_for_flush(self, timeout: float = 30.0) -> bool:
+        """
+        Flush queued events and block until they have been sent.
+
+        Args:
+            timeout: Maximum time to wait in seconds
+
+        Returns:
+            True if the queue was drained, False if timeout exceeded
+        """
+        deadline = time.monotonic() + timeout
+        with self._flushed:
+            while self._sending or not self._queue.empty():
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                # Re-trigger for partial batches left behind by the last flush
+                self._flush_event.set()
+                self._flushed.wait(remaining)
+        return True
+
     def _flush_loop(self) -> None:
         """Background thread that periodically flushes events."""
         while not self._stop_event.is_set():
             # Wait for flush interval or flush event
-            self._flush_event.wait(timeout=self._options.flush_interval)
+            self._flush_event.wait(timeout=self._sizer.flush_wait)
             self._flush_event.clear()
 
             if self._stop_event.is_set():
@@ -116,43 +144,60 @@ class SyncBatchProcessor:
     def _flush_batch(self) -> None:
         """Flush a batch of events from the queue."""
         if self._queue.empty():
+            self._sizer.record_idle()
             return
 
-        batch: list[EventData] = []
-        with self._lock:
-            # Collect up to batch_size events
-            while len(batch) < self._options.batch_size and not self._queue.empty():
+        # Skip if another flush is already draining; producers never wait on this
+        if not self._flush_lock.acquire(blocking=False):
+            return
+
+        batch: list[EventData | EventDataFast] = []
+        self._sending = True
+        try:
+            # Collect up to batch_size events; get_nowait is already thread-safe
+            while len(batch) < self._options.batch_size:
                 try:
-                    event = self._queue.get_nowait()
-                    batch.append(event)
+                    batch.append(self._queue.get_nowait())
                 except Empty:
                     break
+        finally:
+            self._flush_lock.release()
 
-            self._pending_count -= len(batch)
+        # More full batches are waiting; flush again without waiting for the interval
+        if self._queue.qsize() >= self._sizer.batch_size:
+            self._flush_event.set()
 
         if batch:
+            started = time.monotonic()
             try:
                 self._ingest_func(batch)
             except Exception:  # noqa: BLE001
                 # Log error but continue processing
                 pass
+            self._sizer.record_flush(len(batch), time.monotonic() - started)
+        self._sent()
 
     def _flush_remaining(self) -> None:
         """Flush all remaining events during shutdown."""
-        batch: list[EventData] = []
+        batch: list[EventData | EventDataFast] = []
 
-        with self._lock:
-            while not self._queue.empty():
+        with self._flush_lock:
+            self._sending = True
+            while True:
                 try:
-                    event = self._queue.get_nowait()
-                    batch.append(event)
+                    batch.append(self._queue.get_nowait())
                 except Empty:
                     break
 
-            self._pending_count = 0
-
         if batch:
             try:
                 self._ingest_func(batch)
             except Exception:  # noqa: BLE001
                 pass
+        self._sent()
+
+    def _sent(self) -> None:
+        """Mark the taken batch as sent and wake wait_for_flush() callers."""
+        with self._flushed:
+            self._sending = False
+            self._flushed.notify_all()
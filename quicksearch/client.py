@@ -2,9 +2,18 @@
 Base client class with shared logic for both sync and async clients.
 """
 
-from abc import ABC, abstractmethod
+import random
+import socket
+from collections.abc import Mapping
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from types import MappingProxyType
 from typing import Any
+from urllib.request import getproxies
 
+import httpx
+
+from quicksearch._json import JSON_CONTENT_TYPE, loads
 from quicksearch.exceptions import (
     AuthenticationError,
     PermissionError,
@@ -13,7 +22,121 @@ from quicksearch.exceptions import (
     ServerError,
     ValidationError,
 )
-from quicksearch.models import BatchIngestOptions
+from quicksearch.models import (
+    BatchIngestError,
+    BatchIngestOptions,
+    EventResponse,
+    EventSearchResult,
+)
+
+# API paths, resolved against the httpx client's base_url
+EVENTS_PATH = "/api/events"
+SYSLOG_PATH = "/api/syslog"
+
+# Bulk batches at least this large are streamed instead of encoded up front
+STREAM_BULK_MIN_EVENTS = 500
+
+# Applied to every connection; httpcore already sets TCP_NODELAY itself, so small
+# POSTs are not held back by Nagle. SO_KEEPALIVE detects dead idle pooled sockets.
+SOCKET_OPTIONS = [
+    (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1),
+    (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+]
+
+
+def env_proxy_configured() -> bool:
+    """
+    Whether HTTP_PROXY, HTTPS_PROXY or ALL_PROXY is set. httpx only honours
+    these when no explicit transport is given, so with a proxy configured the
+    clients let httpx build its transports and skip SOCKET_OPTIONS.
+    """
+    proxies = getproxies()
+    return any(proxies.get(scheme) for scheme in ("http", "https", "all"))
+
+
+def keepalive_expiry(options: BatchIngestOptions) -> float:
+    """
+    Seconds an idle pooled connection is kept: at least httpx's 5s default,
+    and long enough that connections survive the gap between batch flushes.
+    """
+    return max(5.0, 2 * options.flush_interval)
+
+
+def retry_backoff(
+    options: BatchIngestOptions, attempt: int, retry_after: float | None = None
+) -> float:
+    """
+    Delay before retry ``attempt + 1``: exponential in ``retry_delay``, scaled by
+    a random 0.5-1.5 factor so clients recovering together spread their retries,
+    and never shorter than a ``Retry-After`` the server sent.
+    """
+    backoff = options.retry_delay * (1 << attempt) * random.uniform(0.5, 1.5)
+    if retry_after is not None:
+        return max(retry_after, backoff)
+    return backoff
+
+
+def retry_after_exceeds_schedule(options: BatchIngestOptions, retry_after: float | None) -> bool:
+    """
+    Whether a ``Retry-After`` asks for a longer wait than the longest backoff the
+    retry schedule allows. Such failures are recorded instead of retried, so the
+    batch neither sleeps unboundedly nor retries before the server asked.
+    """
+    if retry_after is None:
+        return False
+    longest = options.retry_delay * (1 << max(options.retry_attempts - 1, 0)) * 1.5
+    return retry_after > longest
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Parse a ``Retry-After`` header given as delay-seconds or an HTTP-date."""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+class ErrorCollector:
+    """
+    Collects the per-event errors of one batch ingest call.
+
+    Every failure is counted, but only the first ``max_errors_stored`` are kept;
+    later ones go to ``error_callback`` (if set) so memory stays bounded when a
+    large batch fails wholesale.
+    """
+
+    def __init__(self, options: BatchIngestOptions) -> None:
+        self._limit = options.max_errors_stored
+        self._callback = options.error_callback
+        self.stored: list[BatchIngestError] = []
+        self.count = 0
+
+    @property
+    def truncated(self) -> bool:
+        """Whether some errors were counted but not stored."""
+        return self.count > len(self.stored)
+
+    def add(self, error: BatchIngestError) -> None:
+        self.count += 1
+        if self._limit is None or len(self.stored) < self._limit:
+            self.stored.append(error)
+        elif self._callback is not None:
+            self._callback(error)
+
+
+# Client error statuses mapped to their exception and fallback message
+_STATUS_ERRORS: dict[int, tuple[type[QuickSearchError], str]] = {
+    400: (ValidationError, "Validation failed"),
+    401: (AuthenticationError, "Authentication required"),
+    403: (PermissionError, "Permission denied"),
+    429: (RateLimitError, "Rate limit exceeded"),
+}
 
 
 class AuthConfig:
@@ -25,27 +148,63 @@ class AuthConfig:
         jwt_token: str | None = None,
         auth_method: str = "auto",
     ) -> None:
-        self.api_key = api_key
-        self.jwt_token = jwt_token
+        self._api_key = api_key
+        self._jwt_token = jwt_token
         self.auth_method = auth_method
+        self._build()
 
-    def get_headers(self) -> dict[str, str]:
-        """Get authentication headers."""
-        if self.api_key:
-            return {"Authorization": f"Bearer {self.api_key}"}
-        if self.jwt_token:
-            return {"Authorization": f"Bearer {self.jwt_token}"}
-        return {}
+    @property
+    def api_key(self) -> str | None:
+        return self._api_key
 
-    def get_query_params(self) -> dict[str, str]:
-        """Get query parameters for API key authentication."""
-        if self.api_key:
-            return {"api_key": self.api_key}
-        return {}
+    @api_key.setter
+    def api_key(self, value: str | None) -> None:
+        self._api_key = value
+        self._build()
 
+    @property
+    def jwt_token(self) -> str | None:
+        return self._jwt_token
 
-class BaseQuickSearchClient(ABC):
-    """Abstract base class for QuickSearch clients."""
+    @jwt_token.setter
+    def jwt_token(self, value: str | None) -> None:
+        self._jwt_token = value
+        self._build()
+
+    def _build(self) -> None:
+        """Precompute the header and query parameter views for the current credentials."""
+        token = self._api_key or self._jwt_token
+        self._headers: Mapping[str, str] = MappingProxyType(
+            {"Authorization": f"Bearer {token}"} if token else {}
+        )
+        self._query_params: Mapping[str, str] = MappingProxyType(
+            {"api_key": self._api_key} if self._api_key else {}
+        )
+        # Pre-encoded to bytes, which httpx passes through without re-encoding
+        wire_headers = {
+            key.encode("ascii"): value.encode("latin-1") for key, value in self._headers.items()
+        }
+        self._wire_headers: Mapping[bytes, bytes] = MappingProxyType(wire_headers)
+        self._json_headers: Mapping[bytes, bytes] = MappingProxyType(
+            {b"Content-Type": JSON_CONTENT_TYPE.encode("ascii"), **wire_headers}
+        )
+
+    def get_headers(self) -> Mapping[str, str]:
+        """Get authentication headers (a read-only view, built once per credential)."""
+        return self._headers
+
+    def get_query_params(self) -> Mapping[str, str]:
+        """Get query parameters for API key authentication (a read-only view)."""
+        return self._query_params
+
+
+class BaseQuickSearchClient:
+    """
+    Shared base for QuickSearch clients.
+
+    A plain class rather than an ABC: the sync and async clients implement
+    ``ingest_event``, ``search_events`` and ``ingest_syslog`` themselves.
+    """
 
     def __init__(
         self,
@@ -55,6 +214,8 @@ class BaseQuickSearchClient(ABC):
         timeout: float = 30.0,
         verify_ssl: bool = True,
         batch_options: BatchIngestOptions | None = None,
+        bulk_ingest_path: str | None = None,
+        validate_responses: bool = False,
     ) -> None:
         self.base_url = base_url.rstrip("/")
         self.timeout = timeout
@@ -62,38 +223,157 @@ class BaseQuickSearchClient(ABC):
         self.auth = AuthConfig(api_key=api_key, jwt_token=jwt_token)
         # Store batch options for subclasses to use
         self._batch_options = batch_options or BatchIngestOptions()
+        # Endpoint accepting a JSON array of events; None sends one POST per event
+        self.bulk_ingest_path = bulk_ingest_path
+        # Cleared once the server answers 404/405 on bulk_ingest_path, after
+        # which batches go out per event for the rest of the client's life
+        self._bulk_supported = True
+        # The server enforces the response schema; re-validating it is opt-in
+        self.validate_responses = validate_responses
+
+    def refresh_auth(self, api_key: str | None = None, jwt_token: str | None = None) -> None:
+        """
+        Rotate the credentials used for subsequent requests.
+
+        Changing ``client.auth.api_key`` or ``client.auth.jwt_token`` in place
+        takes effect on the next request too, so with no arguments this is a no-op.
+        """
+        if api_key is not None or jwt_token is not None:
+            self.auth = AuthConfig(api_key=api_key, jwt_token=jwt_token)
+
+    # Per-request auth material, read from ``auth`` so credential changes apply at once
+    @property
+    def _auth_headers(self) -> Mapping[bytes, bytes]:
+        return self.auth._wire_headers
+
+    @property
+    def _json_headers(self) -> Mapping[bytes, bytes]:
+        return self.auth._json_headers
+
+    @property
+    def _auth_params(self) -> Mapping[str, str]:
+        return self.auth._query_params
 
-    def _make_url(self, endpoint: str) -> str:
-        """Construct full URL from endpoint."""
-        return f"{self.base_url}/{endpoint.lstrip('/')}"
+    @property
+    def _use_bulk(self) -> bool:
+        """Whether batches should go to the bulk endpoint."""
+        return self.bulk_ingest_path is not None and self._bulk_supported
 
-    def _handle_response(self, status_code: int, response_data: dict[str, Any]) -> dict[str, Any]:
+    def _bulk_rejected(self, status_code: int) -> bool:
+        """Record a 404/405 from the bulk endpoint; True if the caller should fall back."""
+        if status_code in (404, 405):
+            self._bulk_supported = False
+            return True
+        return False
+
+    def _search_params(
+        self,
+        query: str | None,
+        limit: int,
+        source: str | None,
+        severity: str | None,
+        timestamp_gte: str | None,
+        extra: dict[str, Any],
+    ) -> dict[str, Any]:
+        """
+        Build the full search query string in one dict: the filters that are
+        not None, then the cached auth parameters.
+        """
+        pairs = (
+            ("q", query),
+            ("limit", limit),
+            ("source", source),
+            ("severity", severity),
+            ("timestamp_gte", timestamp_gte),
+            *extra.items(),
+        )
+        params = {key: value for key, value in pairs if value is not None}
+        params.update(self._auth_params)
+        return params
+
+    def _handle_response(
+        self,
+        status_code: int,
+        response_data: dict[str, Any],
+        retry_after: float | None = None,
+    ) -> dict[str, Any]:
         """Handle HTTP response and raise appropriate exceptions."""
         if status_code in (200, 201):
             return response_data
-        if status_code == 400:
-            raise ValidationError(response_data.get("statusMessage", "Validation failed"))
-        if status_code == 401:
-            raise AuthenticationError(response_data.get("statusMessage", "Authentication required"))
-        if status_code == 403:
-            raise PermissionError(response_data.get("statusMessage", "Permission denied"))
-        if status_code == 429:
-            raise RateLimitError(response_data.get("statusMessage", "Rate limit exceeded"))
-        if status_code >= 500:
-            raise ServerError(response_data.get("statusMessage", "Server error"))
-        raise QuickSearchError(f"Unexpected status code: {status_code}", status_code=status_code)
-
-    @abstractmethod
-    def ingest_event(self, event: Any) -> Any:
-        """Ingest an event."""
-        pass
-
-    @abstractmethod
-    def search_events(self, **kwargs: Any) -> Any:
-        """Search for events."""
-        pass
-
-    @abstractmethod
-    def ingest_syslog(self, syslog_data: Any) -> Any:
-        """Ingest a syslog message."""
-        pass
+        error = _STATUS_ERRORS.get(status_code)
+        if error is not None:
+            exc_type, default_message = error
+            message = response_data.get("statusMessage", default_message)
+            exc: QuickSearchError = exc_type(message)
+        elif status_code >= 500:
+            exc = ServerError(response_data.get("statusMessage", "Server error"))
+        else:
+            exc = QuickSearchError(
+                f"Unexpected status code: {status_code}", status_code=status_code
+            )
+        exc.retry_after = retry_after
+        raise exc
+
+    def _response_data(self, response: httpx.Response) -> dict[str, Any]:
+        """Decode a response body, raising for error statuses with any Retry-After attached."""
+        if not response.content and 200 <= response.status_code < 300:
+            # e.g. 202/204 with no body: accepted, nothing to parse
+            return {}
+        data: dict[str, Any] = loads(response.content)
+        if response.status_code in (200, 201):
+            return data
+        retry_after = parse_retry_after(response.headers.get("Retry-After"))
+        return self._handle_response(response.status_code, data, retry_after)
+
+    def _event_response(self, response: httpx.Response) -> EventResponse:
+        """
+        Decode a single-event response into an EventResponse.
+
+        With ``validate_responses`` the body is parsed and validated in one pass
+        by pydantic-core; otherwise it is trusted and built with
+        ``model_construct``. Error bodies go through ``_handle_response``.
+        """
+        if not response.content and 200 <= response.status_code < 300:
+            # Servers may acknowledge an event without a body; skip decoding
+            return EventResponse.model_construct(success=True, message="", eventId=None)
+        if response.status_code not in (200, 201):
+            self._response_data(response)
+        if self.validate_responses:
+            return EventResponse.model_validate_json(response.content)
+        return EventResponse.model_construct(**loads(response.content))
+
+    def _search_result(self, response: httpx.Response) -> EventSearchResult:
+        """Decode a search response, validating it only if ``validate_responses``."""
+        if response.status_code not in (200, 201):
+            self._response_data(response)
+        if self.validate_responses:
+            return EventSearchResult.model_validate_json(response.content)
+        return EventSearchResult.model_construct(**loads(response.content))
+
+    def _parse_bulk_response(
+        self, response_data: dict[str, Any], count: int
+    ) -> list[EventResponse]:
+        """
+        Map a bulk ingestion response to one EventResponse per submitted event.
+
+        ``results`` may list every event in order, or only some events keyed by
+        ``index`` (e.g. just the failures); events without an entry succeeded.
+        Each entry reports its status as ``success`` or ``ok``.
+        """
+        message = response_data.get("message", "")
+        results = response_data.get("results")
+        if not isinstance(results, list):
+            # Server acknowledged the batch as a whole
+            return [EventResponse(success=True, message=message) for _ in range(count)]
+
+        responses = [EventResponse(success=True, message=message) for _ in range(count)]
+        for position, result in enumerate(results):
+            index = result.get("index", position)
+            if not 0 <= index < count:
+                continue
+            responses[index] = EventResponse(
+                success=result.get("success", result.get("ok", True)),
+                message=result.get("message") or result.get("error") or "",
+                eventId=result.get("eventId"),
+            )
+        return responses
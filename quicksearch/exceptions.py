@@ -11,6 +11,8 @@ class QuickSearchError(Exception):
     def __init__(self, message: str, status_code: int | None = None) -> None:
         self.message = message
         self.status_code = status_code
+        # Seconds the server asked clients to wait (Retry-After), if it said
+        self.retry_after: float | None = None
         super().__init__(self.message)
 
 
@@ -54,3 +56,9 @@ class ConnectionError(QuickSearchError):
 
     def __init__(self, message: str = "Connection failed") -> None:
         super().__init__(message, status_code=None)
+
+
+class QueueFullError(Exception):
+    """Raised when batch buffer is full."""
+
+    pass
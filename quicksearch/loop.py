@@ -0,0 +1,27 @@
+"""
+Event loop helpers for asyncio-heavy workloads.
+"""
+
+import asyncio
+
+
+def install_uvloop() -> None:
+    """
+    Use uvloop as the asyncio event loop policy.
+
+    uvloop is a libuv-based drop-in replacement for the default event loop and
+    speeds up the high fan-out gathers used by AsyncQuickSearchClient. Call this
+    before starting the event loop (e.g. before ``asyncio.run``).
+
+    Raises:
+        ImportError: If uvloop is not installed
+    """
+    try:
+        import uvloop  # type: ignore[import-not-found]
+    except ImportError as e:
+        raise ImportError(
+            "uvloop is not installed. Install it with: pip install 'quicksearch-python-sdk[performance]'"
+        ) from e
+
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
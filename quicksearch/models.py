@@ -5,10 +5,26 @@ These models provide type safety and automatic validation for all
 API requests and responses.
 """
 
+import sys
+from dataclasses import dataclass, fields
 from datetime import datetime
-from typing import Any
+from functools import lru_cache
+from typing import Any, Callable, Literal
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
+
+# Python 3.11+ parses a trailing "Z" natively
+_FROMISOFORMAT_ACCEPTS_Z = sys.version_info >= (3, 11)
+
+
+@lru_cache(maxsize=4096)
+def _is_iso_timestamp(value: str) -> bool:
+    """Whether ``value`` parses as ISO 8601; cached since producers repeat timestamps."""
+    try:
+        datetime.fromisoformat(value if _FROMISOFORMAT_ACCEPTS_Z else value.replace("Z", "+00:00"))
+    except ValueError:
+        return False
+    return True
 
 
 class EventData(BaseModel):
@@ -24,16 +40,37 @@ class EventData(BaseModel):
     @field_validator("timestamp")
     @classmethod
     def validate_timestamp(cls, v: str | None) -> str | None:
-        if v is None:
-            return v
-        try:
-            # Validate ISO 8601 format
-            datetime.fromisoformat(v.replace("Z", "+00:00"))
-        except ValueError as e:
-            raise ValueError("timestamp must be in ISO 8601 format") from e
+        if v is not None and not _is_iso_timestamp(v):
+            raise ValueError("timestamp must be in ISO 8601 format")
         return v
 
 
+@dataclass(slots=True, frozen=True)
+class EventDataFast:
+    """
+    Unvalidated event for hot loops where the data is already known to be valid.
+
+    Accepted anywhere EventData is. No validation runs on construction, so an
+    invalid timestamp is only caught by the server.
+    """
+
+    type: str
+    application: str | None = None
+    timestamp: str | None = None
+    message: str | None = None
+    data: dict[str, Any] | None = None
+    source: str | None = None
+
+    def model_dump(self) -> dict[str, Any]:
+        """Return the non-None fields as a dict, like ``EventData.model_dump(exclude_none=True)``."""
+        result = {}
+        for f in fields(self):
+            value = getattr(self, f.name)
+            if value is not None:
+                result[f.name] = value
+        return result
+
+
 class SyslogData(BaseModel):
     """Represents a syslog event to be ingested."""
 
@@ -47,6 +84,8 @@ class SyslogData(BaseModel):
 class EventResponse(BaseModel):
     """Response from event ingestion."""
 
+    model_config = ConfigDict(frozen=True)
+
     success: bool
     message: str
     eventId: str | None = None
@@ -55,6 +94,8 @@ class EventResponse(BaseModel):
 class EventSearchResult(BaseModel):
     """Response from event search."""
 
+    model_config = ConfigDict(frozen=True)
+
     success: bool
     events: list[dict[str, Any]]
     count: int
@@ -62,10 +103,20 @@ class EventSearchResult(BaseModel):
     processing_time_ms: int | None = None
     query: str | None = None
 
+    @field_validator("events", mode="plain")
+    @classmethod
+    def validate_events(cls, v: Any) -> list[dict[str, Any]]:
+        # Events are free-form dicts, so checking each one costs O(n) for nothing
+        if not isinstance(v, list):
+            raise ValueError("events must be a list")
+        return v
+
 
 class Event(BaseModel):
     """Represents a retrieved event."""
 
+    model_config = ConfigDict(frozen=True)
+
     id: str | None = None
     timestamp: int | str
     timestamp_iso: str | None = None
@@ -79,34 +130,80 @@ class Event(BaseModel):
 class BatchIngestOptions(BaseModel):
     """Configuration for batch ingestion behavior."""
 
+    model_config = ConfigDict(frozen=True)
+
     batch_size: int = Field(default=100, ge=1, le=1000, description="Max events per batch")
     flush_interval: float = Field(default=2.0, ge=0.1, le=60.0, description="Seconds between automatic flushes")
     queue_size_limit: int = Field(default=10000, ge=100, description="Max queued events before blocking")
     max_concurrency: int = Field(default=5, ge=1, le=20, description="Max parallel HTTP requests")
+    burst_limit: int | None = Field(default=None, ge=1, le=100, description="Max parallel HTTP requests during load bursts")
     retry_attempts: int = Field(default=3, ge=0, le=10, description="Number of retry attempts for failed events")
     retry_delay: float = Field(default=1.0, ge=0.1, le=30.0, description="Initial retry delay in seconds (exponential backoff)")
     enabled: bool = Field(default=False, description="Enable automatic batching")
+    adaptive_batching: bool = Field(
+        default=False, description="Tune the flush threshold (up to batch_size) from observed rate and latency"
+    )
+    min_flush_interval: float | None = Field(
+        default=None, ge=0.01, le=60.0, description="Shortest wait between flushes while events arrive quickly"
+    )
+    max_flush_interval: float | None = Field(
+        default=None, ge=0.1, le=300.0, description="Longest wait between flushes while the queue is idle"
+    )
+    compression: Literal["none", "gzip", "zstd"] = Field(
+        default="none", description="Content-Encoding for bulk request bodies above 16 KiB"
+    )
+    max_errors_stored: int | None = Field(
+        default=None, ge=0, description="Max BatchIngestError records kept per result (None keeps all)"
+    )
+    error_callback: Callable[["BatchIngestError"], None] | None = Field(
+        default=None, description="Receives errors past max_errors_stored instead of storing them"
+    )
+
+    @model_validator(mode="after")
+    def _check_flush_bounds(self) -> "BatchIngestOptions":
+        if (
+            self.min_flush_interval is not None
+            and self.max_flush_interval is not None
+            and self.min_flush_interval > self.max_flush_interval
+        ):
+            raise ValueError("min_flush_interval must not exceed max_flush_interval")
+        return self
+
+    @property
+    def peak_concurrency(self) -> int:
+        """Max in-flight requests, allowing bursts above max_concurrency."""
+        return max(self.max_concurrency, self.burst_limit or 0)
 
 
 class BatchIngestError(BaseModel):
     """Details about a failed batch ingestion."""
 
+    model_config = ConfigDict(frozen=True)
+
     event_index: int = Field(description="Index of the event in the original batch")
     event_data: dict[str, Any] = Field(description="The event data that failed")
     error_message: str = Field(description="Error message")
     status_code: int | None = Field(default=None, description="HTTP status code if applicable")
     retried: bool = Field(default=False, description="Whether this error was retried")
+    retry_after: float | None = Field(
+        default=None, description="Seconds the server asked to wait before retrying (Retry-After)"
+    )
 
 
 class BatchIngestResult(BaseModel):
     """Result from batch ingestion with partial success support."""
 
+    model_config = ConfigDict(frozen=True)
+
     success_count: int = Field(description="Number of successfully ingested events")
     failure_count: int = Field(description="Number of failed events")
     total_count: int = Field(description="Total number of events processed")
     errors: list[BatchIngestError] = Field(default_factory=list, description="Detailed error information")
     batch_count: int = Field(default=0, description="Number of batches sent")
     processing_time_ms: int | None = Field(default=None, description="Total processing time in milliseconds")
+    errors_truncated: bool = Field(
+        default=False, description="Whether errors beyond max_errors_stored were left out of errors"
+    )
 
     @property
     def success_rate(self) -> float:
@@ -2,21 +2,36 @@
 Synchronous client for QuickSearch API using httpx.
 """
 
+import threading
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections.abc import Iterator, Mapping
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Union
 
 import httpx
 
-from quicksearch.async_batch_processor import QueueFullError
+from quicksearch import _compression, _json
 from quicksearch.batch_processor import SyncBatchProcessor
-from quicksearch.client import BaseQuickSearchClient
+from quicksearch.client import (
+    EVENTS_PATH,
+    SOCKET_OPTIONS,
+    STREAM_BULK_MIN_EVENTS,
+    SYSLOG_PATH,
+    BaseQuickSearchClient,
+    ErrorCollector,
+    env_proxy_configured,
+    keepalive_expiry,
+    retry_after_exceeds_schedule,
+    retry_backoff,
+)
 from quicksearch.exceptions import ConnectionError as QuickSearchConnectionError
+from quicksearch.exceptions import QueueFullError
 from quicksearch.models import (
     BatchIngestError,
     BatchIngestOptions,
     BatchIngestResult,
     EventData,
+    EventDataFast,
     EventResponse,
     EventSearchResult,
     SyslogData,
@@ -26,6 +41,11 @@ from quicksearch.models import (
 class QuickSearchClient(BaseQuickSearchClient):
     """Synchronous client for QuickSearch API."""
 
+    # httpx clients shared by instances created with share_pool=True, keyed on
+    # everything that shapes the connection pool
+    _shared_clients: dict[tuple[Any, ...], httpx.Client] = {}
+    _shared_lock = threading.Lock()
+
     def __init__(
         self,
         base_url: str = "http://localhost:3000",
@@ -34,14 +54,43 @@ class QuickSearchClient(BaseQuickSearchClient):
         timeout: float = 30.0,
         verify_ssl: bool = True,
         batch_options: BatchIngestOptions | None = None,
+        bulk_ingest_path: str | None = None,
+        validate_responses: bool = False,
+        limits: httpx.Limits | None = None,
+        http2: bool = False,
+        share_pool: bool = False,
     ) -> None:
-        super().__init__(base_url, api_key, jwt_token, timeout, verify_ssl)
-        self._client: httpx.Client | None = None
-        self._limits = httpx.Limits(max_keepalive_connections=5, max_connections=10)
+        super().__init__(
+            base_url,
+            api_key,
+            jwt_token,
+            timeout,
+            verify_ssl,
+            bulk_ingest_path=bulk_ingest_path,
+            validate_responses=validate_responses,
+        )
         self._verify_ssl = verify_ssl
+        # HTTP/2 multiplexes the worker threads' requests over one connection (requires `h2`)
+        self.http2 = http2
 
         # Batch processing support
         self._batch_options = batch_options or BatchIngestOptions()
+
+        # Keep one warm connection per worker thread, across flush intervals,
+        # so batches reuse sockets. Over HTTP/2 the threads' requests share one
+        # multiplexed connection, so only that one is kept.
+        peak = self._batch_options.peak_concurrency
+        self._limits = limits or httpx.Limits(
+            max_keepalive_connections=1 if http2 else max(5, peak),
+            max_connections=max(10, peak),
+            keepalive_expiry=keepalive_expiry(self._batch_options),
+        )
+
+        # Built up front; the client property only rebuilds it after close().
+        # Auth is sent per request, so a shared client never leaks credentials.
+        self._share_pool = share_pool
+        self._client = self._shared_client() if share_pool else self._build_client()
+        self._client_lock = threading.Lock()
         self._batch_processor: SyncBatchProcessor | None = None
 
         if self._batch_options.enabled:
@@ -53,22 +102,76 @@ class QuickSearchClient(BaseQuickSearchClient):
 
     @property
     def client(self) -> httpx.Client:
-        """Lazy initialization of httpx client."""
-        if self._client is None:
-            self._client = httpx.Client(
+        """The underlying httpx client, rebuilt on first use after ``close()``."""
+        client = self._client
+        if client.is_closed:
+            with self._client_lock:
+                if self._client.is_closed:
+                    self._client = self._shared_client() if self._share_pool else self._build_client()
+                client = self._client
+        return client
+
+    def _build_client(self) -> httpx.Client:
+        """Create an httpx client with this instance's pool settings."""
+        if env_proxy_configured():
+            return httpx.Client(
                 base_url=self.base_url,
                 timeout=self.timeout,
                 verify=self._verify_ssl,
                 limits=self._limits,
+                http2=self.http2,
             )
-        return self._client
+        transport = httpx.HTTPTransport(
+            verify=self._verify_ssl,
+            limits=self._limits,
+            http2=self.http2,
+            socket_options=SOCKET_OPTIONS,
+        )
+        return httpx.Client(
+            base_url=self.base_url,
+            timeout=self.timeout,
+            transport=transport,
+        )
 
-    def ingest_event(self, event: EventData | dict[str, Any]) -> EventResponse:
+    def _shared_client(self) -> httpx.Client:
+        """Return the process-wide httpx client for these settings, creating it once."""
+        limits = self._limits
+        key = (
+            self.base_url,
+            self._verify_ssl,
+            self.timeout,
+            self.http2,
+            limits.max_connections,
+            limits.max_keepalive_connections,
+            limits.keepalive_expiry,
+        )
+        with self._shared_lock:
+            client = self._shared_clients.get(key)
+            if client is None or client.is_closed:
+                client = self._shared_clients[key] = self._build_client()
+            return client
+
+    @classmethod
+    def shutdown_all(cls) -> None:
+        """Close every shared httpx client; call once at process teardown."""
+        with cls._shared_lock:
+            clients = list(cls._shared_clients.values())
+            cls._shared_clients.clear()
+        for client in clients:
+            client.close()
+
+    def ingest_event(
+        self,
+        event: EventData | EventDataFast | dict[str, Any],
+        validate: bool = True,
+    ) -> EventResponse:
         """
         Ingest an event into QuickSearch.
 
         Args:
-            event: Event data as EventData model or dictionary
+            event: Event data as EventData, EventDataFast or dictionary
+            validate: Validate dictionaries as EventData before sending; pass
+                False to send a trusted dictionary as-is
 
         Returns:
             EventResponse: Response containing success status and event ID
@@ -85,28 +188,14 @@ class QuickSearchClient(BaseQuickSearchClient):
             >>> response = client.ingest_event(event)
             >>> print(f"Event ID: {response.eventId}")
         """
-        if isinstance(event, dict):
+        if validate and isinstance(event, dict):
             event = EventData(**event)
 
-        headers = {"Content-Type": "application/json", **self.auth.get_headers()}
-        params = self.auth.get_query_params()
-
-        try:
-            response = self.client.post(
-                "/api/events",
-                json=event.model_dump(exclude_none=True),
-                headers=headers,
-                params=params,
-            )
-        except httpx.RequestError as e:
-            raise QuickSearchConnectionError(f"Connection error: {e}") from e
-
-        data = self._handle_response(response.status_code, response.json())
-        return EventResponse(**data)
+        return self._post_event(_json.dumps(event))
 
     def ingest_events(
         self,
-        events: list[EventData | dict[str, Any]],
+        events: list[EventData | EventDataFast | dict[str, Any]],
         batch_options: BatchIngestOptions | None = None,
     ) -> Union[list[EventResponse], BatchIngestResult]:
         """
@@ -119,23 +208,99 @@ class QuickSearchClient(BaseQuickSearchClient):
         Returns:
             List of EventResponse objects if batching disabled,
             BatchIngestResult if batching enabled
+
+        With batching disabled, the first failure is raised and no responses
+        are returned. Events still queued at that point are not sent, but
+        earlier events and those already in flight may have been accepted.
         """
-        # Convert dicts to EventData
+        # Use provided options or client default
+        options = batch_options or self._batch_options
+
+        if len(events) == 1 and not options.enabled:
+            # Nothing to parallelize; skip the fan-out machinery
+            return [self.ingest_event(events[0])]
+
+        # Convert dicts to EventData; models pass through unchanged
         event_data_list = [
-            event if isinstance(event, EventData) else EventData(**event)
+            event if isinstance(event, (EventData, EventDataFast)) else EventData(**event)
             for event in events
         ]
 
-        # Use provided options or client default
-        options = batch_options or self._batch_options
-
         if not options.enabled:
-            # Backward compatible: sequential ingestion
-            return [self.ingest_event(event) for event in event_data_list]
+            if self._use_bulk:
+                # One request per batch_size chunk instead of one per event
+                size = options.batch_size
+                return [
+                    response
+                    for i in range(0, len(event_data_list), size)
+                    for response in self._post_events_bulk(event_data_list[i : i + size], options)
+                ]
+            # One POST per event, spread over max_concurrency threads sharing
+            # the connection pool; map() keeps the responses in input order.
+            # When it reaches a failure it cancels the events not yet started
+            # and re-raises, but requests already in flight are still sent and
+            # their responses are discarded
+            workers = min(options.max_concurrency, len(event_data_list))
+            if workers <= 1:
+                return [self._ingest_validated(event) for event in event_data_list]
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                return list(executor.map(self._ingest_validated, event_data_list))
 
         # Use concurrent batch ingestion with partial success
         return self._ingest_events_with_result(event_data_list, options)
 
+    def _ingest_validated(self, event: EventData | EventDataFast) -> EventResponse:
+        """POST an event that ingest_events has already converted to a model."""
+        return self._post_event(_json.dumps(event))
+
+    def ingest_events_raw(self, events: list[dict[str, Any]]) -> list[EventResponse]:
+        """
+        Ingest pre-built event dictionaries without constructing EventData models.
+
+        The dictionaries are serialized as-is, so no client-side validation is
+        performed. Use this for high-volume producers whose payloads are already
+        known to be valid; invalid events are rejected by the server instead.
+
+        Args:
+            events: List of event dictionaries in the API wire format
+
+        Returns:
+            List of EventResponse objects, one per event
+        """
+        return [self._post_event(_json.dumps(event)) for event in events]
+
+    def ingest_events_bulk(
+        self,
+        events: list[EventData | EventDataFast | dict[str, Any]],
+        batch_options: BatchIngestOptions | None = None,
+    ) -> BatchIngestResult:
+        """
+        Ingest events through ``bulk_ingest_path``, one request per ``batch_size`` chunk.
+
+        Chunks are sent concurrently and retried like batched ingestion. If the
+        server turns out not to have the bulk endpoint (404/405), the client
+        remembers that and sends events one request at a time instead.
+
+        Args:
+            events: List of event data
+            batch_options: Optional batch configuration (overrides client default)
+
+        Returns:
+            BatchIngestResult with per-event errors
+
+        Raises:
+            ValueError: If the client was created without ``bulk_ingest_path``
+        """
+        if self.bulk_ingest_path is None:
+            raise ValueError("ingest_events_bulk requires bulk_ingest_path to be set")
+
+        options = batch_options or self._batch_options
+        event_data_list = [
+            event if isinstance(event, (EventData, EventDataFast)) else EventData(**event)
+            for event in events
+        ]
+        return self._ingest_events_bulk_with_result(event_data_list, options)
+
     def search_events(
         self,
         query: str | None = None,
@@ -170,37 +335,31 @@ class QuickSearchClient(BaseQuickSearchClient):
             >>> for event in result.events:
             ...     print(f"{event['timestamp']}: {event['message']}")
         """
-        params = {
-            "q": query,
-            "limit": limit,
-            "source": source,
-            "severity": severity,
-            "timestamp_gte": timestamp_gte,
-            **kwargs,
-        }
-        params = {k: v for k, v in params.items() if v is not None}
-
-        headers = self.auth.get_headers()
-        auth_params = self.auth.get_query_params()
+        params = self._search_params(query, limit, source, severity, timestamp_gte, kwargs)
 
         try:
             response = self.client.get(
-                "/api/events",
-                params={**params, **auth_params},
-                headers=headers,
+                EVENTS_PATH,
+                params=params,
+                headers=self._auth_headers,
             )
         except httpx.RequestError as e:
             raise QuickSearchConnectionError(f"Connection error: {e}") from e
 
-        data = self._handle_response(response.status_code, response.json())
-        return EventSearchResult(**data)
+        return self._search_result(response)
 
-    def ingest_syslog(self, syslog_data: SyslogData | str | dict[str, Any]) -> EventResponse:
+    def ingest_syslog(
+        self,
+        syslog_data: SyslogData | str | dict[str, Any],
+        validate: bool = True,
+    ) -> EventResponse:
         """
         Ingest a syslog message into QuickSearch.
 
         Args:
             syslog_data: Syslog data as SyslogData model, raw string, or dictionary
+            validate: Validate dictionaries as SyslogData before sending; pass
+                False to send a dictionary as-is
 
         Returns:
             EventResponse: Response containing success status and event ID
@@ -223,40 +382,25 @@ class QuickSearchClient(BaseQuickSearchClient):
             >>> raw_syslog = "<34>Oct 11 22:14:15 mymachine su: 'su root' failed for user"
             >>> response = client.ingest_syslog(raw_syslog)
         """
-        headers = {"Content-Type": "application/json", **self.auth.get_headers()}
-        params = self.auth.get_query_params()
+        if isinstance(syslog_data, str):
+            # Raw syslog string
+            content: str | bytes = syslog_data
+        elif validate and isinstance(syslog_data, dict):
+            content = _json.dumps(SyslogData(**syslog_data))
+        else:
+            content = _json.dumps(syslog_data)
 
         try:
-            if isinstance(syslog_data, str):
-                # Raw syslog string
-                response = self.client.post(
-                    "/api/syslog",
-                    content=syslog_data,
-                    headers=headers,
-                    params=params,
-                )
-            elif isinstance(syslog_data, dict):
-                # Dictionary - convert to SyslogData
-                syslog = SyslogData(**syslog_data)
-                response = self.client.post(
-                    "/api/syslog",
-                    json=syslog.model_dump(exclude_none=True),
-                    headers=headers,
-                    params=params,
-                )
-            else:
-                # SyslogData model
-                response = self.client.post(
-                    "/api/syslog",
-                    json=syslog_data.model_dump(exclude_none=True),
-                    headers=headers,
-                    params=params,
-                )
+            response = self.client.post(
+                SYSLOG_PATH,
+                content=content,
+                headers=self._json_headers,
+                params=self._auth_params,
+            )
         except httpx.RequestError as e:
             raise QuickSearchConnectionError(f"Connection error: {e}") from e
 
-        data = self._handle_response(response.status_code, response.json())
-        return EventResponse(**data)
+        return self._event_response(response)
 
     def close(self) -> None:
         """Close the session and release resources."""
@@ -265,9 +409,9 @@ class QuickSearchClient(BaseQuickSearchClient):
             self._batch_processor.stop()
             self._batch_processor = None
 
-        if self._client:
+        # Shared pools outlive any one instance; see shutdown_all()
+        if not self._share_pool:
             self._client.close()
-            self._client = None
 
     def __enter__(self) -> "QuickSearchClient":
         return self
@@ -277,13 +421,14 @@ class QuickSearchClient(BaseQuickSearchClient):
 
     def ingest_event_batched(
         self,
-        event: EventData | dict[str, Any],
+        event: EventData | EventDataFast | dict[str, Any],
     ) -> None:
         """
         Add a single event to the batch queue (non-blocking).
 
         The event will be sent in the next batch flush based on
-        batch_size or flush_interval triggers.
+        batch_size or flush_interval triggers. The event is encoded when
+        its batch is flushed, so changes made to it before then are sent.
 
         Args:
             event: Event data to queue
@@ -295,7 +440,7 @@ class QuickSearchClient(BaseQuickSearchClient):
         if not self._batch_processor:
             raise RuntimeError("Batching is not enabled. Set batch_options.enabled=True")
 
-        event_data = event if isinstance(event, EventData) else EventData(**event)
+        event_data = event if isinstance(event, (EventData, EventDataFast)) else EventData(**event)
         success = self._batch_processor.add_event(event_data)
 
         if not success:
@@ -309,85 +454,285 @@ class QuickSearchClient(BaseQuickSearchClient):
         if self._batch_processor:
             self._batch_processor.force_flush()
 
-    def _ingest_batch_internal(self, batch: list[EventData]) -> list[EventResponse]:
+    def wait_for_flush(self, timeout: float = 30.0) -> bool:
+        """
+        Flush queued events and block until they have been sent.
+
+        Args:
+            timeout: Maximum time to wait in seconds
+
+        Returns:
+            True if all queued events were sent, False if timeout exceeded
+        """
+        if not self._batch_processor:
+            return True
+        return self._batch_processor.wait_for_flush(timeout)
+
+    def _post_event(self, body: bytes) -> EventResponse:
+        """POST an already-encoded event body to the events endpoint."""
+        try:
+            response = self.client.post(
+                EVENTS_PATH,
+                content=body,
+                headers=self._json_headers,
+                params=self._auth_params,
+            )
+        except httpx.RequestError as e:
+            raise QuickSearchConnectionError(f"Connection error: {e}") from e
+
+        return self._event_response(response)
+
+    def _post_events_bulk(
+        self, batch: list[EventData | EventDataFast], options: BatchIngestOptions
+    ) -> list[EventResponse]:
+        """POST a whole batch as one JSON array, falling back to one POST per event."""
+        responses = self._post_bulk_request(batch, options)
+        if responses is None:
+            return [self._post_event(_json.dumps(event)) for event in batch]
+        return responses
+
+    def _post_bulk_request(
+        self, batch: list[EventData | EventDataFast], options: BatchIngestOptions
+    ) -> list[EventResponse] | None:
+        """POST a whole batch to the bulk endpoint; None if the server does not support it."""
+        assert self.bulk_ingest_path is not None
+
+        headers: Mapping[bytes, bytes] = self._json_headers
+        content: bytes | Iterator[bytes]
+        compression = options.compression
+        if compression != "none":
+            content, encoding = _compression.compress(_json.dumps_many(batch), compression)
+            if encoding:
+                headers = {**headers, b"Content-Encoding": encoding.encode("ascii")}
+        elif len(batch) >= STREAM_BULK_MIN_EVENTS:
+            content = _json.iter_many(batch)
+        else:
+            content = _json.dumps_many(batch)
+
+        try:
+            response = self.client.post(
+                self.bulk_ingest_path,
+                content=content,
+                headers=headers,
+                params=self._auth_params,
+            )
+        except httpx.RequestError as e:
+            raise QuickSearchConnectionError(f"Connection error: {e}") from e
+
+        if self._bulk_rejected(response.status_code):
+            return None
+
+        data = self._response_data(response)
+        return self._parse_bulk_response(data, len(batch))
+
+    def _ingest_batch_internal(self, batch: list[EventData | EventDataFast]) -> list[EventResponse]:
         """Internal method to ingest a batch (called by batch processor)."""
+        if self._use_bulk:
+            return self._post_events_bulk(batch, self._batch_options)
         return [self.ingest_event(event) for event in batch]
 
     def _ingest_events_with_result(
         self,
-        events: list[EventData],
+        events: list[EventData | EventDataFast],
         options: BatchIngestOptions,
     ) -> BatchIngestResult:
         """Ingest events concurrently and return detailed result."""
-        start_time = time.time()
-        errors: list[BatchIngestError] = []
-        success_count = 0
+        if self._use_bulk:
+            return self._ingest_events_bulk_with_result(events, options)
 
-        def ingest_with_retry(event: EventData, index: int) -> tuple[bool, BatchIngestError | None]:
-            """Ingest with retry logic."""
-            last_error = None
+        start_ns = time.perf_counter_ns()
+        errors = ErrorCollector(options)
+        success_count = self._ingest_each(list(enumerate(events)), options, errors)
+        processing_time_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
 
+        return BatchIngestResult(
+            success_count=success_count,
+            failure_count=errors.count,
+            total_count=len(events),
+            errors=errors.stored,
+            errors_truncated=errors.truncated,
+            processing_time_ms=processing_time_ms,
+        )
+
+    def _ingest_each(
+        self,
+        items: list[tuple[int, EventData | EventDataFast]],
+        options: BatchIngestOptions,
+        errors: ErrorCollector,
+    ) -> int:
+        """
+        POST ``(index, event)`` pairs one per request with retry.
+
+        Failures are added to ``errors`` under their index; returns the number
+        of events that succeeded.
+        """
+        success_count = 0
+
+        def ingest_once(item: tuple[int, EventData | EventDataFast, bytes]) -> Exception | None:
+            """POST one encoded event; returns the failure instead of raising it."""
+            try:
+                self._post_event(item[2])
+            except Exception as e:  # noqa: BLE001
+                return e
+            return None
+
+        # Events are retried in rounds, as in the async client: every retryable
+        # failure from one round is re-sent together after a single jittered
+        # backoff, so no worker thread sits in a sleep while holding a slot.
+        # Bodies are encoded once here and re-sent as-is on every retry.
+        pending = [(index, event, _json.dumps(event)) for index, event in items]
+
+        # One pool for every round; bursting above max_concurrency if allowed
+        with ThreadPoolExecutor(max_workers=options.peak_concurrency) as executor:
             for attempt in range(options.retry_attempts + 1):
-                try:
-                    self.ingest_event(event)
-                    return True, None
-                except Exception as e:  # noqa: BLE001
-                    status_code = getattr(e, "status_code", None)
+                is_last_attempt = attempt == options.retry_attempts
+                retryable: list[tuple[int, EventData | EventDataFast, bytes]] = []
+                # Retry-After values the server sent with this round's failures
+                waits: list[float] = []
 
-                    # Don't retry 4xx errors except 429
+                for item, error in zip(pending, executor.map(ingest_once, pending)):
+                    if error is None:
+                        success_count += 1
+                        continue
+
+                    status_code = getattr(error, "status_code", None)
+                    retry_after = getattr(error, "retry_after", None)
+
+                    # Don't retry 4xx errors except 429, or sooner than Retry-After asks
                     if status_code and 400 <= status_code < 500 and status_code != 429:
-                        last_error = BatchIngestError(
+                        retry = False
+                    else:
+                        retry = not is_last_attempt and not retry_after_exceeds_schedule(
+                            options, retry_after
+                        )
+
+                    if retry:
+                        retryable.append(item)
+                        if retry_after is not None:
+                            waits.append(retry_after)
+                        continue
+
+                    # Only failed events are converted back to a dict
+                    index, event, _ = item
+                    errors.add(
+                        BatchIngestError(
                             event_index=index,
                             event_data=event.model_dump(),
-                            error_message=str(e),
+                            error_message=str(error),
                             status_code=status_code,
-                            retried=False,
+                            retried=attempt > 0,
+                            retry_after=retry_after,
                         )
-                        break
-
-                    last_error = BatchIngestError(
-                        event_index=index,
-                        event_data=event.model_dump(),
-                        error_message=str(e),
-                        status_code=status_code,
-                        retried=attempt > 0,
                     )
 
-                    if attempt < options.retry_attempts:
-                        delay = options.retry_delay * (2**attempt)
-                        time.sleep(delay)
+                if not retryable:
+                    break
+
+                time.sleep(retry_backoff(options, attempt, max(waits, default=None)))
+                pending = retryable
+
+        return success_count
+
+    def _ingest_events_bulk_with_result(
+        self,
+        events: list[EventData | EventDataFast],
+        options: BatchIngestOptions,
+    ) -> BatchIngestResult:
+        """Ingest events through the bulk endpoint, one request per batch_size chunk."""
+        start_ns = time.perf_counter_ns()
+        errors = ErrorCollector(options)
+        success_count = 0
+        size = options.batch_size
+        chunks = [events[i : i + size] for i in range(0, len(events), size)]
 
-            return False, last_error
+        def ingest_chunk(
+            chunk: list[EventData | EventDataFast],
+        ) -> tuple[list[EventResponse] | None, Exception | None, int]:
+            """
+            POST one chunk with retry; returns its responses or the last error.
 
-        # Process with thread pool
-        with ThreadPoolExecutor(max_workers=options.max_concurrency) as executor:
-            futures = {
-                executor.submit(ingest_with_retry, event, i): (event, i)
-                for i, event in enumerate(events)
-            }
+            Returns neither once the bulk endpoint is found to be unsupported,
+            so the caller sends the chunk's events one by one instead.
+            """
+            last_exception: Exception | None = None
+            attempt = 0
 
-            for future in as_completed(futures):
+            for attempt in range(options.retry_attempts + 1):
+                # Another chunk may have found the bulk endpoint unsupported
+                if not self._use_bulk:
+                    return None, None, attempt
                 try:
-                    success, error = future.result()
-                    if success:
-                        success_count += 1
-                    elif error:
-                        errors.append(error)
+                    return self._post_bulk_request(chunk, options), None, attempt
                 except Exception as e:  # noqa: BLE001
-                    errors.append(
+                    last_exception = e
+                    status_code = getattr(e, "status_code", None)
+                    retry_after = getattr(e, "retry_after", None)
+
+                    # Don't retry 4xx errors except 429, or sooner than Retry-After asks
+                    if status_code and 400 <= status_code < 500 and status_code != 429:
+                        break
+                    if retry_after_exceeds_schedule(options, retry_after):
+                        break
+
+                    if attempt < options.retry_attempts:
+                        time.sleep(retry_backoff(options, attempt, retry_after))
+
+            return None, last_exception, attempt
+
+        workers = max(1, min(options.peak_concurrency, len(chunks)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(ingest_chunk, chunks))
+
+        # Events of chunks the bulk endpoint never accepted, sent one by one below
+        fallback: list[tuple[int, EventData | EventDataFast]] = []
+
+        for chunk_index, (chunk, result) in enumerate(zip(chunks, results)):
+            responses, exception, attempt = result
+            offset = chunk_index * size
+
+            if responses is None and exception is None:
+                fallback.extend((offset + i, event) for i, event in enumerate(chunk))
+                continue
+
+            if responses is None:
+                # The whole request failed; every event in the chunk failed with it
+                for i, event in enumerate(chunk):
+                    errors.add(
+                        BatchIngestError(
+                            event_index=offset + i,
+                            event_data=event.model_dump(),
+                            error_message=str(exception),
+                            status_code=getattr(exception, "status_code", None),
+                            retried=attempt > 0,
+                            retry_after=getattr(exception, "retry_after", None),
+                        )
+                    )
+                continue
+
+            for i, (event, response) in enumerate(zip(chunk, responses)):
+                if response.success:
+                    success_count += 1
+                else:
+                    errors.add(
                         BatchIngestError(
-                            event_index=-1,
-                            event_data={},
-                            error_message=str(e),
+                            event_index=offset + i,
+                            event_data=event.model_dump(),
+                            error_message=response.message,
                         )
                     )
 
-        processing_time_ms = int((time.time() - start_time) * 1000)
+        if fallback:
+            # Per event, with retry, so only the events that fail are re-sent
+            success_count += self._ingest_each(fallback, options, errors)
+
+        processing_time_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
 
         return BatchIngestResult(
             success_count=success_count,
-            failure_count=len(errors),
+            failure_count=errors.count,
             total_count=len(events),
-            errors=errors,
+            errors=errors.stored,
+            errors_truncated=errors.truncated,
+            batch_count=len(chunks),
             processing_time_ms=processing_time_ms,
         )
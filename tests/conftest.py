@@ -2,10 +2,52 @@
 Pytest configuration and fixtures for testing.
 """
 
+import os
+
+import httpx
 import pytest
+import respx
+
+from quicksearch import EventData, QuickSearchClient, SyslogData
+
+
+@pytest.hookimpl(trylast=True)
+def pytest_collection_modifyitems(config, items):
+    """Skip integration tests up front when the backend cannot be reached."""
+    # trylast: -m deselection has already run, so filtered-out runs never probe
+    integration = [item for item in items if "integration" in item.keywords]
+    if not integration:
+        return
+
+    base_url = os.environ.get("QUICKSEARCH_BASE_URL", "http://localhost:3000")
+    try:
+        # Any HTTP response means the server is up; only transport errors skip
+        httpx.get(base_url, timeout=1.0)
+    except httpx.TransportError as e:
+        skip = pytest.mark.skip(reason=f"Backend not reachable at {base_url}: {e}")
+        for item in integration:
+            item.add_marker(skip)
+
+
+@pytest.fixture(scope="session")
+def client():
+    """Shared default client for tests that neither reconfigure nor close it."""
+    with QuickSearchClient(api_key="test-api-key") as client:
+        yield client
+
 
-# Mock event data fixtures
 @pytest.fixture
+def respx_mock():
+    """respx router with the QuickSearch API routes registered by name."""
+    with respx.mock(base_url="http://localhost:3000", assert_all_called=False) as router:
+        router.post("/api/events", name="ingest")
+        router.get("/api/events", name="search")
+        router.post("/api/syslog", name="syslog")
+        yield router
+
+
+# Mock payload fixtures are session-scoped and shared; tests must not mutate them
+@pytest.fixture(scope="session")
 def mock_event_data():
     """Mock event data for testing."""
     return {
@@ -16,7 +58,7 @@ def mock_event_data():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_syslog_data():
     """Mock syslog data for testing."""
     return {
@@ -28,7 +70,19 @@ def mock_syslog_data():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def event_model(mock_event_data):
+    """EventData built once from the trusted mock_event_data, skipping validation."""
+    return EventData.model_construct(**mock_event_data)
+
+
+@pytest.fixture(scope="session")
+def syslog_model(mock_syslog_data):
+    """SyslogData built once from the trusted mock_syslog_data, skipping validation."""
+    return SyslogData.model_construct(**mock_syslog_data)
+
+
+@pytest.fixture(scope="session")
 def mock_api_response():
     """Mock API response for testing."""
     return {
@@ -38,7 +92,13 @@ def mock_api_response():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def mock_201(mock_api_response):
+    """Prebuilt 201 response for routes that always succeed; respx clones it per request."""
+    return httpx.Response(201, json=mock_api_response)
+
+
+@pytest.fixture(scope="session")
 def mock_search_response():
     """Mock search response for testing."""
     return {
@@ -59,3 +119,9 @@ def mock_search_response():
         "processing_time_ms": 12,
         "query": "user_login",
     }
+
+
+@pytest.fixture(scope="session")
+def mock_search_200(mock_search_response):
+    """Prebuilt 200 search response; respx clones it per request."""
+    return httpx.Response(200, json=mock_search_response)
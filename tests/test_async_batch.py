@@ -2,6 +2,9 @@
 Tests for asynchronous batch processing.
 """
 
+import asyncio
+import json
+
 import httpx
 import pytest
 import respx
@@ -17,7 +20,7 @@ from quicksearch import (
 
 
 @respx.mock
-async def test_async_ingest_events_with_batching_enabled(mock_event_data, mock_api_response):
+async def test_async_ingest_events_with_batching_enabled(event_model, mock_201):
     """Test async batch ingestion with batching enabled returns BatchIngestResult."""
     async with AsyncQuickSearchClient(
         api_key="test-api-key",
@@ -28,11 +31,9 @@ async def test_async_ingest_events_with_batching_enabled(mock_event_data, mock_a
         ),
     ) as client:
         # Mock the API endpoint
-        respx.post("http://localhost:3000/api/events").mock(
-            return_value=httpx.Response(201, json=mock_api_response)
-        )
+        respx.post("http://localhost:3000/api/events").mock(return_value=mock_201)
 
-        events = [EventData(**mock_event_data) for _ in range(10)]
+        events = [event_model] * 10
         result = await client.ingest_events(events)
 
         assert isinstance(result, BatchIngestResult)
@@ -41,18 +42,16 @@ async def test_async_ingest_events_with_batching_enabled(mock_event_data, mock_a
 
 
 @respx.mock
-async def test_async_ingest_events_with_batching_disabled(mock_event_data, mock_api_response):
+async def test_async_ingest_events_with_batching_disabled(event_model, mock_201):
     """Test that batching can be disabled (default behavior)."""
     async with AsyncQuickSearchClient(
         api_key="test-api-key",
         batch_options=BatchIngestOptions(enabled=False),
     ) as client:
         # Mock the API endpoint
-        respx.post("http://localhost:3000/api/events").mock(
-            return_value=httpx.Response(201, json=mock_api_response)
-        )
+        respx.post("http://localhost:3000/api/events").mock(return_value=mock_201)
 
-        events = [EventData(**mock_event_data) for _ in range(3)]
+        events = [event_model] * 3
         responses = await client.ingest_events(events)
 
         # Should return list of EventResponse (backward compatible)
@@ -62,18 +61,16 @@ async def test_async_ingest_events_with_batching_disabled(mock_event_data, mock_
 
 
 @respx.mock
-async def test_async_ingest_events_with_batch_options_override(mock_event_data, mock_api_response):
+async def test_async_ingest_events_with_batch_options_override(event_model, mock_201):
     """Test per-call batch options override."""
     async with AsyncQuickSearchClient(
         api_key="test-api-key",
         batch_options=BatchIngestOptions(enabled=False),
     ) as client:
         # Mock the API endpoint
-        respx.post("http://localhost:3000/api/events").mock(
-            return_value=httpx.Response(201, json=mock_api_response)
-        )
+        respx.post("http://localhost:3000/api/events").mock(return_value=mock_201)
 
-        events = [EventData(**mock_event_data) for _ in range(5)]
+        events = [event_model] * 5
 
         # Call with batching enabled via override
         result = await client.ingest_events(
@@ -90,16 +87,9 @@ async def test_async_ingest_events_with_batch_options_override(mock_event_data,
 
 
 @respx.mock
-async def test_async_ingest_event_batched_queuing(mock_event_data, mock_api_response):
+async def test_async_ingest_event_batched_queuing(event_model, mock_201):
     """Test queuing events with async ingest_event_batched."""
-    call_count = 0
-
-    def mock_response(request):
-        nonlocal call_count
-        call_count += 1
-        return httpx.Response(201, json=mock_api_response)
-
-    respx.post("http://localhost:3000/api/events").mock(side_effect=mock_response)
+    route = respx.post("http://localhost:3000/api/events").mock(return_value=mock_201)
 
     async with AsyncQuickSearchClient(
         api_key="test-api-key",
@@ -111,39 +101,29 @@ async def test_async_ingest_event_batched_queuing(mock_event_data, mock_api_resp
     ) as client:
         # Queue events
         for _ in range(3):
-            event = EventData(**mock_event_data)
-            await client.ingest_event_batched(event)
+            await client.ingest_event_batched(event_model)
 
         # Force flush
         await client.flush_batch()
 
-        assert call_count == 3
+        assert route.call_count == 3
 
 
 @respx.mock
-async def test_async_ingest_event_batched_when_disabled(mock_event_data):
+async def test_async_ingest_event_batched_when_disabled(event_model):
     """Test ingest_event_batched raises error when batching is disabled."""
     async with AsyncQuickSearchClient(
         api_key="test-api-key",
         batch_options=BatchIngestOptions(enabled=False),
     ) as client:
-        event = EventData(**mock_event_data)
-
         with pytest.raises(RuntimeError, match="Batching is not enabled"):
-            await client.ingest_event_batched(event)
+            await client.ingest_event_batched(event_model)
 
 
 @respx.mock
-async def test_async_batch_processor_auto_flush_on_close(mock_event_data, mock_api_response):
+async def test_async_batch_processor_auto_flush_on_close(event_model, mock_201):
     """Test that async batch processor flushes on close."""
-    call_count = 0
-
-    def mock_response(request):
-        nonlocal call_count
-        call_count += 1
-        return httpx.Response(201, json=mock_api_response)
-
-    respx.post("http://localhost:3000/api/events").mock(side_effect=mock_response)
+    route = respx.post("http://localhost:3000/api/events").mock(return_value=mock_201)
 
     async with AsyncQuickSearchClient(
         api_key="test-api-key",
@@ -155,27 +135,23 @@ async def test_async_batch_processor_auto_flush_on_close(mock_event_data, mock_a
     ) as client:
         # Queue events
         for _ in range(3):
-            event = EventData(**mock_event_data)
-            await client.ingest_event_batched(event)
+            await client.ingest_event_batched(event_model)
 
-        assert call_count == 0
+        assert route.call_count == 0
 
     # After context exit, events should be flushed
-    assert call_count == 3
+    assert route.call_count == 3
 
 
 @respx.mock
-async def test_async_concurrent_batch_ingestion_with_retries(mock_event_data, mock_api_response):
+async def test_async_concurrent_batch_ingestion_with_retries(event_model, mock_201):
     """Test async concurrent batch ingestion with retry logic."""
-    call_count = 0
 
-    def mock_response(request):
-        nonlocal call_count
-        call_count += 1
-        # Simulate every 3rd request failing
-        if call_count % 3 == 0:
+    def mock_response(request, route):
+        # Simulate every 3rd request failing; respx counts calls before this one
+        if route.call_count % 3 == 2:
             return httpx.Response(500, json={"statusMessage": "Server error"})
-        return httpx.Response(201, json=mock_api_response)
+        return mock_201
 
     respx.post("http://localhost:3000/api/events").mock(side_effect=mock_response)
 
@@ -189,7 +165,7 @@ async def test_async_concurrent_batch_ingestion_with_retries(mock_event_data, mo
             retry_delay=0.1,  # Short delay for tests
         ),
     ) as client:
-        events = [EventData(**mock_event_data) for _ in range(9)]
+        events = [event_model] * 9
         result = await client.ingest_events(events)
 
         assert isinstance(result, BatchIngestResult)
@@ -199,18 +175,17 @@ async def test_async_concurrent_batch_ingestion_with_retries(mock_event_data, mo
 
 
 @respx.mock
-async def test_async_batch_ingest_partial_success(mock_event_data, mock_api_response):
+async def test_async_batch_ingest_partial_success(mock_event_data, mock_201):
     """Test async batch ingestion with partial success."""
+
     def mock_response(request):
         # Fail events with odd index
-        import json
-
         body = json.loads(request.content)
         event_type = body.get("type", "")
         if "fail" in event_type:
             return httpx.Response(400, json={"statusMessage": "Bad request"})
 
-        return httpx.Response(201, json=mock_api_response)
+        return mock_201
 
     respx.post("http://localhost:3000/api/events").mock(side_effect=mock_response)
 
@@ -240,11 +215,9 @@ async def test_async_batch_ingest_partial_success(mock_event_data, mock_api_resp
 
 
 @respx.mock
-async def test_async_batch_processor_queue_full(mock_event_data, mock_api_response):
+async def test_async_batch_processor_queue_full(event_model, mock_201):
     """Test QueueFullError when buffer is full."""
-    respx.post("http://localhost:3000/api/events").mock(
-        return_value=httpx.Response(201, json=mock_api_response)
-    )
+    respx.post("http://localhost:3000/api/events").mock(return_value=mock_201)
 
     async with AsyncQuickSearchClient(
         api_key="test-api-key",
@@ -255,10 +228,252 @@ async def test_async_batch_processor_queue_full(mock_event_data, mock_api_respon
     ) as client:
         # Add events up to the limit
         for _ in range(100):
-            event = EventData(**mock_event_data)
-            await client.ingest_event_batched(event)
+            await client.ingest_event_batched(event_model)
 
         # Next event should raise QueueFullError
         with pytest.raises(QueueFullError, match="Batch buffer full"):
-            event = EventData(**mock_event_data)
-            await client.ingest_event_batched(event)
+            await client.ingest_event_batched(event_model)
+
+
+@respx.mock
+async def test_async_batched_flush_uses_bulk_endpoint(event_model):
+    """Test async queued events are flushed as one bulk request when configured."""
+    route = respx.post("http://localhost:3000/api/events/bulk").mock(
+        return_value=httpx.Response(201, json={"success": True, "message": "ok"})
+    )
+
+    async with AsyncQuickSearchClient(
+        api_key="test-api-key",
+        bulk_ingest_path="/api/events/bulk",
+        batch_options=BatchIngestOptions(enabled=True, batch_size=100, flush_interval=60.0),
+    ) as client:
+        for _ in range(3):
+            await client.ingest_event_batched(event_model)
+        await client.flush_batch()
+
+    assert route.call_count == 1
+    assert len(json.loads(route.calls.last.request.content)) == 3
+
+
+@respx.mock
+async def test_async_ingest_events_single_event(mock_event_data, mock_201):
+    """Test a single event is ingested directly when batching is disabled."""
+    async with AsyncQuickSearchClient(api_key="test-api-key") as client:
+        route = respx.post("http://localhost:3000/api/events").mock(return_value=mock_201)
+
+        responses = await client.ingest_events([mock_event_data])
+
+        assert len(responses) == 1
+        assert responses[0].eventId == "1704067200000-abc123"
+        assert route.call_count == 1
+
+
+@respx.mock
+async def test_async_large_bulk_batch_is_streamed(event_model):
+    """Test large bulk batches are sent as a streamed request body."""
+    route = respx.post("http://localhost:3000/api/events/bulk").mock(
+        return_value=httpx.Response(201, json={"success": True, "message": "ok"})
+    )
+
+    async with AsyncQuickSearchClient(api_key="test-api-key", bulk_ingest_path="/api/events/bulk") as client:
+        await client._ingest_batch_internal([event_model] * 600)
+
+    request = route.calls.last.request
+    assert "Content-Length" not in request.headers
+    assert len(json.loads(await request.aread())) == 600
+
+
+@respx.mock
+async def test_async_ingest_events_bulk_chunks_by_batch_size(event_model):
+    """Test batched ingest_events sends one bulk request per batch_size chunk."""
+
+    def bulk_response(request):
+        body = json.loads(request.content)
+        results = [{"success": i != 0, "error": "rejected"} for i in range(len(body))]
+        return httpx.Response(201, json={"success": True, "results": results})
+
+    route = respx.post("http://localhost:3000/api/events/bulk").mock(side_effect=bulk_response)
+
+    async with AsyncQuickSearchClient(api_key="test-api-key", bulk_ingest_path="/api/events/bulk") as client:
+        result = await client.ingest_events(
+            [event_model] * 10,
+            batch_options=BatchIngestOptions(enabled=True, batch_size=4),
+        )
+
+    assert route.call_count == 3
+    assert result.batch_count == 3
+    assert result.success_count == 7
+    assert sorted(e.event_index for e in result.errors) == [0, 4, 8]
+    assert result.errors[0].error_message == "rejected"
+
+
+@respx.mock
+async def test_async_ingest_events_bulk_chunk_failure(event_model):
+    """Test a rejected bulk request marks every event in the chunk as failed."""
+    respx.post("http://localhost:3000/api/events/bulk").mock(
+        return_value=httpx.Response(400, json={"statusMessage": "Bad request"})
+    )
+
+    async with AsyncQuickSearchClient(api_key="test-api-key", bulk_ingest_path="/api/events/bulk") as client:
+        result = await client.ingest_events(
+            [event_model] * 3,
+            batch_options=BatchIngestOptions(enabled=True, batch_size=2, retry_attempts=0),
+        )
+
+    assert result.failure_count == 3
+    assert all(e.status_code == 400 for e in result.errors)
+
+
+@respx.mock
+async def test_async_batch_processor_flushes_on_batch_size(event_model, mock_201):
+    """Test a full batch is flushed without waiting for flush_interval."""
+    route = respx.post("http://localhost:3000/api/events").mock(return_value=mock_201)
+
+    async with AsyncQuickSearchClient(
+        api_key="test-api-key",
+        batch_options=BatchIngestOptions(enabled=True, batch_size=5, flush_interval=60.0),
+    ) as client:
+        for _ in range(5):
+            await client.ingest_event_batched(event_model)
+
+        for _ in range(10):
+            await asyncio.sleep(0.01)
+            if route.call_count == 5:
+                break
+
+        assert route.call_count == 5
+
+
+@respx.mock
+async def test_async_retries_failed_events_in_one_round(event_model, mock_201, monkeypatch):
+    """Test retryable failures share a single backoff sleep per round."""
+
+    def mock_response(request, route):
+        # The first six calls fail; respx counts calls before this one
+        if route.call_count < 6:
+            return httpx.Response(503, json={"statusMessage": "Unavailable"})
+        return mock_201
+
+    respx.post("http://localhost:3000/api/events").mock(side_effect=mock_response)
+
+    sleeps = []
+    real_sleep = asyncio.sleep
+
+    async def record_sleep(delay, *args, **kwargs):
+        sleeps.append(delay)
+        await real_sleep(0)
+
+    async with AsyncQuickSearchClient(api_key="test-api-key") as client:
+        monkeypatch.setattr(asyncio, "sleep", record_sleep)
+        result = await client.ingest_events(
+            [event_model] * 6,
+            batch_options=BatchIngestOptions(enabled=True, retry_attempts=2, retry_delay=0.5),
+        )
+        monkeypatch.undo()
+
+    assert result.success_count == 6
+    assert len(sleeps) == 1
+    assert 0.25 <= sleeps[0] <= 0.75
+
+
+@respx.mock
+async def test_async_retries_reuse_encoded_body(mock_201, monkeypatch):
+    """Test an event is encoded once even when it is retried."""
+    from quicksearch import EventDataFast, _json
+
+    responses = iter([httpx.Response(503, json={"statusMessage": "Unavailable"})])
+    respx.post("http://localhost:3000/api/events").mock(
+        side_effect=lambda request: next(responses, mock_201)
+    )
+
+    encoded = []
+    real_dumps = _json.dumps
+    monkeypatch.setattr(_json, "dumps", lambda obj: encoded.append(obj) or real_dumps(obj))
+
+    async with AsyncQuickSearchClient(api_key="test-api-key") as client:
+        result = await client.ingest_events(
+            [EventDataFast(type="click"), EventDataFast(type="view")],
+            batch_options=BatchIngestOptions(enabled=True, retry_attempts=1, retry_delay=0.1),
+        )
+
+    assert result.success_count == 2
+    assert sum(isinstance(obj, EventDataFast) for obj in encoded) == 2
+
+
+@respx.mock
+async def test_async_bulk_response_with_indexed_failures(event_model):
+    """Test bulk responses that only list failed events by index."""
+    respx.post("http://localhost:3000/api/events/bulk").mock(
+        return_value=httpx.Response(
+            201,
+            json={"success": True, "results": [{"index": 1, "ok": False, "error": "bad type"}]},
+        )
+    )
+
+    async with AsyncQuickSearchClient(api_key="test-api-key", bulk_ingest_path="/api/events/bulk") as client:
+        result = await client.ingest_events(
+            [event_model] * 3,
+            batch_options=BatchIngestOptions(enabled=True, batch_size=10),
+        )
+
+    assert result.success_count == 2
+    assert [(e.event_index, e.error_message) for e in result.errors] == [(1, "bad type")]
+
+
+@pytest.mark.parametrize(
+    ("base_url", "expected_peak"),
+    [("https://localhost:3000", 8), ("http://localhost:3000", 2)],
+    ids=["https", "cleartext"],
+)
+@respx.mock
+async def test_async_http2_bulk_chunk_limit(event_model, base_url, expected_peak):
+    """Test HTTP/2 widens bulk chunk concurrency over TLS, up to a fixed multiple."""
+    in_flight = 0
+    peak = 0
+
+    async def bulk_response(request):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return httpx.Response(201, json={"success": True})
+
+    respx.post(f"{base_url}/api/events/bulk").mock(side_effect=bulk_response)
+
+    async with AsyncQuickSearchClient(
+        base_url=base_url, api_key="test-api-key", bulk_ingest_path="/api/events/bulk", http2=True
+    ) as client:
+        result = await client.ingest_events(
+            [event_model] * 16,
+            batch_options=BatchIngestOptions(enabled=True, batch_size=1, max_concurrency=2),
+        )
+
+    assert (result.success_count, peak) == (16, expected_peak)
+
+
+@respx.mock
+async def test_async_bulk_fallback_sends_each_event_once(mock_201):
+    """Test a failed event in the per-event fallback does not re-send the others."""
+    respx.post("http://localhost:3000/api/events/bulk").mock(
+        return_value=httpx.Response(404, json={})
+    )
+
+    def respond(request):
+        if json.loads(request.content)["type"] == "e1":
+            return httpx.Response(400, json={"statusMessage": "Bad request"})
+        return mock_201
+
+    single = respx.post("http://localhost:3000/api/events").mock(side_effect=respond)
+
+    async with AsyncQuickSearchClient(
+        api_key="test-api-key", bulk_ingest_path="/api/events/bulk"
+    ) as client:
+        result = await client.ingest_events(
+            [EventData(type=f"e{i}") for i in range(3)],
+            batch_options=BatchIngestOptions(enabled=True, retry_attempts=2, retry_delay=0.1),
+        )
+
+    sent = sorted(json.loads(call.request.content)["type"] for call in single.calls)
+    assert sent == ["e0", "e1", "e2"]
+    assert (result.success_count, [error.event_index for error in result.errors]) == (2, [1])
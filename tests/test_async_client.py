@@ -2,47 +2,44 @@
 Tests for the asynchronous QuickSearch client.
 """
 
+import asyncio
+import json
+import re
+import socket
+
 import httpx
 import pytest
-import respx
 
 from quicksearch import (
     AsyncQuickSearchClient,
     AuthenticationError,
-    EventData,
     EventResponse,
-    EventSearchResult,
-    SyslogData,
     ValidationError,
 )
+from quicksearch.async_client import _for_each_bounded, _gather_bounded
+
+_VALIDATION_RE = re.compile("Event type is required")
+_AUTH_RE = re.compile("Invalid API key")
 
 
-@respx.mock
-async def test_async_ingest_event_success(mock_event_data, mock_api_response):
+async def test_async_ingest_event_success(event_model, mock_201, respx_mock):
     """Test successful async event ingestion."""
     async with AsyncQuickSearchClient(api_key="test-api-key") as client:
         # Mock the API endpoint
-        route = respx.post("http://localhost:3000/api/events").mock(
-            return_value=httpx.Response(201, json=mock_api_response)
-        )
+        route = respx_mock["ingest"].mock(return_value=mock_201)
 
-        # Test with EventData model
-        event = EventData(**mock_event_data)
-        response = await client.ingest_event(event)
+        response = await client.ingest_event(event_model)
 
         assert response.success is True
         assert response.eventId == "1704067200000-abc123"
         assert route.called
 
 
-@respx.mock
-async def test_async_ingest_event_with_dict(mock_event_data, mock_api_response):
+async def test_async_ingest_event_with_dict(mock_event_data, mock_201, respx_mock):
     """Test async event ingestion with dictionary input."""
     async with AsyncQuickSearchClient(api_key="test-api-key") as client:
         # Mock the API endpoint
-        respx.post("http://localhost:3000/api/events").mock(
-            return_value=httpx.Response(201, json=mock_api_response)
-        )
+        respx_mock["ingest"].mock(return_value=mock_201)
 
         # Test with dictionary
         response = await client.ingest_event(mock_event_data)
@@ -51,30 +48,33 @@ async def test_async_ingest_event_with_dict(mock_event_data, mock_api_response):
         assert response.eventId == "1704067200000-abc123"
 
 
-@respx.mock
-async def test_async_ingest_event_validation_error(mock_event_data):
-    """Test async event validation error handling."""
+@pytest.mark.parametrize(
+    ("status", "body", "exc", "match"),
+    [
+        (
+            400,
+            {"statusMessage": "Event type is required"},
+            ValidationError,
+            _VALIDATION_RE,
+        ),
+        (401, {"statusMessage": "Invalid API key"}, AuthenticationError, _AUTH_RE),
+    ],
+    ids=["validation", "authentication"],
+)
+async def test_async_ingest_event_error(status, body, exc, match, mock_event_data, respx_mock):
+    """Test async error statuses are raised as the matching exception."""
     async with AsyncQuickSearchClient(api_key="test-api-key") as client:
-        # Mock the API endpoint to return 400
-        respx.post("http://localhost:3000/api/events").mock(
-            return_value=httpx.Response(
-                400,
-                json={"statusMessage": "Event type is required"},
-            )
-        )
-
-        with pytest.raises(ValidationError, match="Event type is required"):
+        respx_mock["ingest"].mock(return_value=httpx.Response(status, json=body))
+
+        with pytest.raises(exc, match=match):
             await client.ingest_event(mock_event_data)
 
 
-@respx.mock
-async def test_async_search_events(mock_search_response):
+async def test_async_search_events(mock_search_200, respx_mock):
     """Test async event search."""
     async with AsyncQuickSearchClient(api_key="test-api-key") as client:
         # Mock the API endpoint
-        respx.get("http://localhost:3000/api/events").mock(
-            return_value=httpx.Response(200, json=mock_search_response)
-        )
+        respx_mock["search"].mock(return_value=mock_search_200)
 
         result = await client.search_events(query="user_login", limit=10)
 
@@ -84,36 +84,29 @@ async def test_async_search_events(mock_search_response):
         assert result.events[0]["type"] == "user_login"
 
 
-@respx.mock
-async def test_async_ingest_syslog(mock_syslog_data, mock_api_response):
+async def test_async_ingest_syslog(syslog_model, mock_201, respx_mock):
     """Test async syslog ingestion."""
     async with AsyncQuickSearchClient(api_key="test-api-key") as client:
         # Mock the API endpoint
-        respx.post("http://localhost:3000/api/syslog").mock(
-            return_value=httpx.Response(201, json=mock_api_response)
-        )
+        respx_mock["syslog"].mock(return_value=mock_201)
 
-        syslog = SyslogData(**mock_syslog_data)
-        response = await client.ingest_syslog(syslog)
+        response = await client.ingest_syslog(syslog_model)
 
         assert response.success is True
         assert response.eventId == "1704067200000-abc123"
 
 
-@respx.mock
-async def test_async_ingest_events_batch(mock_event_data, mock_api_response):
+@pytest.mark.parametrize("count", [1, 3, 10, 100])
+async def test_async_ingest_events_batch(count, event_model, mock_201, respx_mock):
     """Test async batch event ingestion."""
     async with AsyncQuickSearchClient(api_key="test-api-key") as client:
         # Mock the API endpoint
-        respx.post("http://localhost:3000/api/events").mock(
-            return_value=httpx.Response(201, json=mock_api_response)
-        )
+        route = respx_mock["ingest"].mock(return_value=mock_201)
 
-        events = [EventData(**mock_event_data) for _ in range(3)]
-        responses = await client.ingest_events(events)
+        # The client does not mutate its input, so one shared model is enough
+        responses = await client.ingest_events([event_model] * count)
 
-        assert len(responses) == 3
-        assert all(r.success for r in responses)
+        assert ([r.success for r in responses], route.call_count) == ([True] * count, count)
 
 
 async def test_async_context_manager():
@@ -139,3 +132,122 @@ async def test_async_not_connected_error():
 
     with pytest.raises(RuntimeError, match="Client not connected"):
         await client.search_events()
+
+
+async def test_async_ingest_events_raw(mock_event_data, mock_201, respx_mock):
+    """Test async raw dictionary ingestion."""
+    async with AsyncQuickSearchClient(api_key="test-api-key") as client:
+        respx_mock["ingest"].mock(return_value=mock_201)
+
+        responses = await client.ingest_events_raw([mock_event_data] * 3)
+
+        assert len(responses) == 3
+        assert all(isinstance(r, EventResponse) for r in responses)
+
+
+async def test_async_http2_enabled():
+    """Test HTTP/2 can be enabled on the underlying transport."""
+    async with AsyncQuickSearchClient(api_key="test-api-key", http2=True) as client:
+        assert client.http2 is True
+        assert client.limits.max_keepalive_connections == 1
+        assert client._client is not None
+
+
+async def test_gather_bounded_preserves_order_and_limit():
+    """Test bounded fan-out keeps input order and respects the limit."""
+    in_flight = 0
+    peak = 0
+
+    async def work(index, item):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.001 * (10 - index))
+        in_flight -= 1
+        return item * 2
+
+    results = await _gather_bounded(work, list(range(10)), limit=3)
+
+    assert results == [i * 2 for i in range(10)]
+    assert peak == 3
+
+
+async def test_gather_bounded_cancels_on_failure():
+    """Test the first failure cancels outstanding work and propagates."""
+    started = []
+
+    async def work(index, item):
+        started.append(index)
+        if index == 1:
+            raise ValueError("boom")
+        await asyncio.sleep(1)
+
+    with pytest.raises(ValueError, match="boom"):
+        await _gather_bounded(work, list(range(100)), limit=2)
+
+    assert len(started) < 100
+
+
+async def test_for_each_bounded_consumes_iterator():
+    """Test items can be streamed from a generator without building a list."""
+    seen = []
+
+    async def work(index, item):
+        seen.append((index, item))
+
+    await _for_each_bounded(work, (i * 2 for i in range(5)), limit=2)
+
+    assert sorted(seen) == [(i, i * 2) for i in range(5)]
+
+
+async def test_async_refresh_auth(mock_event_data, mock_201, respx_mock):
+    """Test rotated credentials are used for subsequent requests."""
+    route = respx_mock["ingest"].mock(return_value=mock_201)
+
+    async with AsyncQuickSearchClient(api_key="old-key") as client:
+        await client.ingest_event(mock_event_data)
+        client.refresh_auth(api_key="new-key")
+        await client.ingest_event(mock_event_data)
+
+    assert route.calls[0].request.headers["Authorization"] == "Bearer old-key"
+    assert route.calls[1].request.headers["Authorization"] == "Bearer new-key"
+    assert route.calls[1].request.url.params["api_key"] == "new-key"
+
+
+async def test_async_warm_up_on_connect(respx_mock):
+    """Test connect() opens a connection before the first request when warm_up is set."""
+    route = respx_mock.head("/api/events").mock(return_value=httpx.Response(405))
+
+    async with AsyncQuickSearchClient(api_key="test-api-key", warm_up=True):
+        pass
+
+    assert route.call_count == 1
+
+
+async def test_async_transport_sets_socket_options():
+    """Test the async transport disables Nagle and enables TCP keepalive."""
+    async with AsyncQuickSearchClient(api_key="test-api-key") as client:
+        pool = client._client._transport._pool
+
+        assert (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1) in pool._socket_options
+        assert (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1) in pool._socket_options
+
+
+async def test_async_env_proxy_is_honoured(monkeypatch):
+    """Test HTTP_PROXY from the environment still routes requests through the proxy."""
+    monkeypatch.setenv("HTTP_PROXY", "http://proxy.local:8080")
+
+    async with AsyncQuickSearchClient(api_key="test-api-key") as client:
+        assert client._client._mounts
+
+
+async def test_async_ingest_events_without_validation(mock_201, respx_mock):
+    """Test validate=False sends dictionaries exactly as given."""
+    route = respx_mock["ingest"].mock(return_value=mock_201)
+    payload = {"type": "click", "timestamp": "not-a-timestamp", "extra": 1}
+
+    async with AsyncQuickSearchClient(api_key="test-api-key") as client:
+        responses = await client.ingest_events([payload, payload], validate=False)
+
+    assert len(responses) == 2
+    assert json.loads(route.calls.last.request.content) == payload
@@ -3,6 +3,7 @@ Tests for batch ingestion models.
 """
 
 import pytest
+from pydantic import ValidationError
 
 from quicksearch.models import (
     BatchIngestError,
@@ -25,6 +26,9 @@ class TestBatchIngestOptions:
         assert options.retry_attempts == 3
         assert options.retry_delay == 1.0
         assert options.enabled is False
+        assert options.burst_limit is None
+        assert options.compression == "none"
+        assert options.peak_concurrency == 5
 
     def test_custom_values(self):
         """Test creating BatchIngestOptions with custom values."""
@@ -46,45 +50,31 @@ class TestBatchIngestOptions:
         assert options.retry_delay == 2.0
         assert options.enabled is True
 
-    def test_batch_size_validation(self):
-        """Test validation of batch_size field."""
-        # Too large
-        with pytest.raises(Exception):  # Pydantic ValidationError
-            BatchIngestOptions(batch_size=2000)
-
-        # Too small
-        with pytest.raises(Exception):
-            BatchIngestOptions(batch_size=0)
-
-    def test_flush_interval_validation(self):
-        """Test validation of flush_interval field."""
-        # Too small
-        with pytest.raises(Exception):
-            BatchIngestOptions(flush_interval=0.01)
-
-    def test_queue_size_limit_validation(self):
-        """Test validation of queue_size_limit field."""
-        # Too small
-        with pytest.raises(Exception):
-            BatchIngestOptions(queue_size_limit=10)
-
-    def test_max_concurrency_validation(self):
-        """Test validation of max_concurrency field."""
-        # Too large
-        with pytest.raises(Exception):
-            BatchIngestOptions(max_concurrency=100)
-
-    def test_retry_attempts_validation(self):
-        """Test validation of retry_attempts field."""
-        # Too large
-        with pytest.raises(Exception):
-            BatchIngestOptions(retry_attempts=20)
-
-    def test_retry_delay_validation(self):
-        """Test validation of retry_delay field."""
-        # Too small
-        with pytest.raises(Exception):
-            BatchIngestOptions(retry_delay=0.01)
+    def test_burst_limit(self):
+        """Test burst_limit raises peak concurrency but never lowers it."""
+        assert BatchIngestOptions(max_concurrency=5, burst_limit=15).peak_concurrency == 15
+        assert BatchIngestOptions(max_concurrency=5, burst_limit=2).peak_concurrency == 5
+
+        with pytest.raises(ValidationError, match="burst_limit"):
+            BatchIngestOptions(burst_limit=500)
+
+    @pytest.mark.parametrize(
+        ("kwargs", "match"),
+        [
+            ({"batch_size": 2000}, "batch_size"),
+            ({"batch_size": 0}, "batch_size"),
+            ({"flush_interval": 0.01}, "flush_interval"),
+            ({"queue_size_limit": 10}, "queue_size_limit"),
+            ({"max_concurrency": 100}, "max_concurrency"),
+            ({"retry_attempts": 20}, "retry_attempts"),
+            ({"retry_delay": 0.01}, "retry_delay"),
+            ({"min_flush_interval": 5.0, "max_flush_interval": 1.0}, "must not exceed"),
+        ],
+    )
+    def test_invalid_options(self, kwargs, match):
+        """Test out-of-range options are rejected with an error naming the problem."""
+        with pytest.raises(ValidationError, match=match):
+            BatchIngestOptions(**kwargs)
 
 
 class TestBatchIngestError:
@@ -165,42 +155,21 @@ class TestBatchIngestResult:
         assert result.batch_count == 0
         assert result.processing_time_ms is None
 
-    def test_success_rate_property(self):
+    @pytest.mark.parametrize(
+        ("success_count", "failure_count", "total_count", "expected"),
+        [
+            (80, 20, 100, 80.0),
+            (100, 0, 100, 100.0),
+            (0, 100, 100, 0.0),
+            (0, 0, 0, 100.0),  # No events counts as full success
+        ],
+    )
+    def test_success_rate(self, success_count, failure_count, total_count, expected):
         """Test success_rate property calculation."""
         result = BatchIngestResult(
-            success_count=80,
-            failure_count=20,
-            total_count=100,
-        )
-
-        assert result.success_rate == 80.0
-
-    def test_success_rate_all_success(self):
-        """Test success_rate with 100% success."""
-        result = BatchIngestResult(
-            success_count=100,
-            failure_count=0,
-            total_count=100,
-        )
-
-        assert result.success_rate == 100.0
-
-    def test_success_rate_all_failure(self):
-        """Test success_rate with 0% success."""
-        result = BatchIngestResult(
-            success_count=0,
-            failure_count=100,
-            total_count=100,
-        )
-
-        assert result.success_rate == 0.0
-
-    def test_success_rate_empty(self):
-        """Test success_rate with zero events."""
-        result = BatchIngestResult(
-            success_count=0,
-            failure_count=0,
-            total_count=0,
+            success_count=success_count,
+            failure_count=failure_count,
+            total_count=total_count,
         )
 
-        assert result.success_rate == 100.0
+        assert result.success_rate == expected
@@ -0,0 +1,66 @@
+"""
+Tests for adaptive batch sizing.
+"""
+
+from quicksearch._batch_sizing import AdaptiveBatchSizer
+from quicksearch.models import BatchIngestOptions
+
+
+def _sizer(**kwargs):
+    return AdaptiveBatchSizer(BatchIngestOptions(batch_size=500, flush_interval=2.0, **kwargs))
+
+
+def test_fixed_size_when_disabled():
+    """Test the configured batch_size is kept when adaptive batching is off."""
+    sizer = _sizer()
+    sizer._last_flush -= 1.0
+    sizer.record_flush(count=1, elapsed=0.01)
+    assert sizer.batch_size == 500
+
+
+def test_low_rate_shrinks_batches():
+    """Test a trickle of events flushes in small batches."""
+    sizer = _sizer(adaptive_batching=True)
+    sizer._last_flush -= 2.0
+    sizer.record_flush(count=2, elapsed=0.05)
+    assert 1 <= sizer.batch_size <= 3
+
+
+def test_high_rate_grows_to_batch_size():
+    """Test a high event rate is capped at the configured batch_size."""
+    sizer = _sizer(adaptive_batching=True)
+    sizer._last_flush -= 0.1
+    sizer.record_flush(count=500, elapsed=0.05)
+    assert sizer.batch_size == 500
+
+
+def test_slow_flushes_use_full_batches():
+    """Test flushes slower than the interval budget fall back to full batches."""
+    sizer = _sizer(adaptive_batching=True)
+    sizer._last_flush -= 1.0
+    sizer.record_flush(count=100, elapsed=3.0)
+    assert sizer.batch_size == 500
+
+
+def test_flush_wait_adapts_within_bounds():
+    """Test the flush timer shortens after full batches and backs off when idle."""
+    sizer = _sizer(min_flush_interval=0.05, max_flush_interval=10.0)
+    assert sizer.flush_wait == 2.0
+
+    sizer.record_flush(count=500, elapsed=0.01)
+    assert sizer.flush_wait == 0.05
+
+    for _ in range(10):
+        sizer.record_idle()
+    assert sizer.flush_wait == 10.0
+
+    sizer.reset_wait()
+    assert sizer.flush_wait == 2.0
+
+
+def test_flush_wait_fixed_without_bounds():
+    """Test the flush timer stays at flush_interval when no bounds are set."""
+    sizer = _sizer()
+    sizer.record_idle()
+    sizer.record_flush(count=500, elapsed=0.01)
+    assert sizer.flush_wait == 2.0
@@ -0,0 +1,31 @@
+"""
+Tests for request body compression.
+"""
+
+import gzip
+
+import pytest
+
+from quicksearch import _compression
+
+
+def test_small_bodies_are_not_compressed():
+    """Test bodies under the threshold are sent as-is."""
+    body = b'{"type":"test"}'
+    assert _compression.compress(body, "gzip") == (body, None)
+
+
+def test_gzip_roundtrip():
+    """Test gzip-compressed bodies decompress to the original."""
+    body = b'{"type":"test"},' * 2000
+    compressed, encoding = _compression.compress(body, "gzip")
+    assert encoding == "gzip"
+    assert len(compressed) < len(body)
+    assert gzip.decompress(compressed) == body
+
+
+def test_zstd_requires_zstandard(monkeypatch):
+    """Test a clear error is raised when zstandard is missing."""
+    monkeypatch.setattr(_compression, "zstandard", None)
+    with pytest.raises(ImportError, match="zstandard is not installed"):
+        _compression.compress(b"x" * _compression.COMPRESSION_MIN_BYTES, "zstd")
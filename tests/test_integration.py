@@ -1,14 +1,15 @@
 """
 Integration tests against the real QuickSearch backend.
 
-These tests require the Nuxt.js server to be running on http://localhost:3000.
+These tests require the Nuxt.js server to be running on http://localhost:3000;
+conftest.py skips them when it cannot be reached.
 """
 
 import os
 import time
 
 import pytest
-from httpx import HTTPStatusError, RemoteProtocolError
+import pytest_asyncio
 
 from quicksearch import (
     AsyncQuickSearchClient,
@@ -23,34 +24,46 @@ API_KEY = os.environ.get("QUICKSEARCH_API_KEY", "d3c70de4fbd25eadf464aa485752dea
 BASE_URL = os.environ.get("QUICKSEARCH_BASE_URL", "http://localhost:3000")
 
 
-@pytest.mark.integration
-def test_ingest_event_real():
-    """Test ingesting an event to the real backend."""
+def _make_event(**overrides):
+    """Build a trusted test event; model_construct skips validating known-good data."""
+    fields = {
+        "type": "integration_test",
+        "application": "python_sdk",
+        "data": {"test": True, "source": "integration_test"},
+        **overrides,
+    }
+    return EventData.model_construct(**fields)
+
+
+@pytest.fixture(scope="module")
+def live_client():
+    """One client, and so one connection pool, shared by the module's tests."""
     client = QuickSearchClient(base_url=BASE_URL, api_key=API_KEY)
+    yield client
+    client.close()
 
-    event = EventData(
-        type="integration_test",
-        application="python_sdk",
-        message="Test event from Python SDK",
-        data={"test": True, "source": "integration_test"},
-    )
 
-    try:
-        response = client.ingest_event(event)
-        assert response.success is True
-        assert response.eventId is not None
-        print(f"Event ingested with ID: {response.eventId}")
-    except (HTTPStatusError, RemoteProtocolError) as e:
-        pytest.skip(f"Backend not available: {e}")
-    finally:
-        client.close()
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def async_live_client():
+    """Async counterpart of live_client; tests using it must share its module loop."""
+    async with AsyncQuickSearchClient(base_url=BASE_URL, api_key=API_KEY) as client:
+        yield client
 
 
 @pytest.mark.integration
-def test_ingest_syslog_real():
-    """Test ingesting syslog to the real backend."""
-    client = QuickSearchClient(base_url=BASE_URL, api_key=API_KEY)
+def test_ingest_event_real(live_client):
+    """Test ingesting an event to the real backend."""
+    event = _make_event(message="Test event from Python SDK")
+
+    response = live_client.ingest_event(event)
+    assert response.success is True
+    assert response.eventId is not None
+    print(f"Event ingested with ID: {response.eventId}")
+
 
+@pytest.mark.integration
+def test_ingest_syslog_real(live_client):
+    """Test ingesting syslog to the real backend."""
     syslog = SyslogData(
         type="test_syslog",
         severity="info",
@@ -59,99 +72,79 @@ def test_ingest_syslog_real():
         data={"test": True},
     )
 
-    try:
-        response = client.ingest_syslog(syslog)
-        assert response.success is True
-        assert response.eventId is not None
-        print(f"Syslog ingested with ID: {response.eventId}")
-    except (HTTPStatusError, RemoteProtocolError) as e:
-        pytest.skip(f"Backend not available: {e}")
-    finally:
-        client.close()
+    response = live_client.ingest_syslog(syslog)
+    assert response.success is True
+    assert response.eventId is not None
+    print(f"Syslog ingested with ID: {response.eventId}")
 
 
 @pytest.mark.integration
-def test_search_events_real():
+@pytest.mark.slow
+def test_search_events_real(live_client):
     """Test searching events from the real backend.
 
     Note: Events are buffered for 15 seconds before being indexed to Meilisearch.
     This test may timeout if searching immediately after ingestion.
     """
-    client = QuickSearchClient(base_url=BASE_URL, api_key=API_KEY)
+    # Ingest some test events in one call; the client sends them concurrently
+    event_type = f"search_test_{time.time_ns()}"
+    events = [
+        _make_event(
+            type=event_type,
+            message=f"Test event {i} for search",
+            data={"searchable": True, "index": i},
+        )
+        for i in range(3)
+    ]
+    live_client.ingest_events(events)
 
-    try:
-        # Ingest some test events
-        for i in range(3):
-            event = EventData(
-                type=f"search_test_{int(time.time())}",
-                application="python_sdk",
-                message=f"Test event {i} for search",
-                data={"searchable": True, "index": i},
-            )
-            client.ingest_event(event)
-
-        # Wait for events to be indexed (buffer delay is 15 seconds)
-        # We'll use a shorter timeout for the test
-        print("Waiting for events to be indexed (may take up to 15 seconds)...")
-        time.sleep(2)  # Brief wait
-
-        # Search for recently ingested events
-        # Note: May not find immediately due to buffering
-        result = client.search_events(query="python_sdk", limit=50)
-        assert result.success is True
-        assert isinstance(result.events, list)
-        print(f"Found {result.count} events (note: events are buffered for 15s)")
-
-        # Even if count is 0, the search should succeed
-        assert isinstance(result.count, int)
-    except (HTTPStatusError, RemoteProtocolError) as e:
-        pytest.skip(f"Backend not available: {e}")
-    finally:
-        client.close()
+    # Poll until this test's events are indexed (buffer delay is 15 seconds); the
+    # event_type is unique to this run, so older events cannot end the wait early
+    deadline = time.monotonic() + 15.0
+    while True:
+        result = live_client.search_events(query=event_type, limit=50)
+        indexed = [event for event in result.events if event.get("type") == event_type]
+        if len(indexed) >= len(events) or time.monotonic() >= deadline:
+            break
+        time.sleep(0.5)
+
+    # Note: May still find nothing if the buffer has not been flushed
+    assert result.success is True
+    assert isinstance(result.events, list)
+    print(f"Found {result.count} events (note: events are buffered for 15s)")
+
+    # Even if count is 0, the search should succeed
+    assert isinstance(result.count, int)
 
 
 @pytest.mark.integration
-def test_batch_ingest_real():
+def test_batch_ingest_real(live_client):
     """Test batch ingestion to the real backend."""
-    client = QuickSearchClient(base_url=BASE_URL, api_key=API_KEY)
-
     events = [
-        EventData(type=f"batch_test_{int(time.time())}_{i}", data={"index": i})
+        _make_event(type=f"batch_test_{int(time.time())}_{i}", data={"index": i})
         for i in range(5)
     ]
 
-    try:
-        responses = client.ingest_events(events)
-        assert len(responses) == 5
-        assert all(r.success for r in responses)
-        print(f"Batch ingested {len(responses)} events")
-        for i, resp in enumerate(responses):
-            print(f"  [{i}] {resp.eventId}")
-    except (HTTPStatusError, RemoteProtocolError) as e:
-        pytest.skip(f"Backend not available: {e}")
-    finally:
-        client.close()
+    responses = live_client.ingest_events(events)
+    assert len(responses) == 5
+    assert all(r.success for r in responses)
+    print(f"Batch ingested {len(responses)} events (first id={responses[0].eventId})")
 
 
 @pytest.mark.integration
-@pytest.mark.asyncio
-async def test_async_ingest_event_real():
+@pytest.mark.asyncio(loop_scope="module")
+async def test_async_ingest_event_real(async_live_client):
     """Test async event ingestion to the real backend."""
-    async with AsyncQuickSearchClient(base_url=BASE_URL, api_key=API_KEY) as client:
-        event = EventData(
-            type="async_test",
-            application="python_sdk",
-            message="Async test event",
-            data={"async": True, "timestamp": int(time.time())},
-        )
+    event = _make_event(
+        type="async_test",
+        message="Async test event",
+        data={"async": True, "timestamp": int(time.time())},
+    )
 
-        try:
-            response = await client.ingest_event(event)
-            assert response.success is True
-            assert response.eventId is not None
-            print(f"Async event ingested with ID: {response.eventId}")
-        except (HTTPStatusError, RemoteProtocolError) as e:
-            pytest.skip(f"Backend not available: {e}")
+    response = await async_live_client.ingest_event(event)
+    assert response.success is True
+    assert response.eventId is not None
+    print(f"Async event ingested with ID: {response.eventId}")
 
 
 @pytest.mark.integration
@@ -160,24 +153,20 @@ def test_invalid_api_key():
     client = QuickSearchClient(base_url=BASE_URL, api_key="invalid-key-1234567890abcdef")
 
     try:
-        event = EventData(type="test", data={"test": True})
+        event = _make_event(type="test", data={"test": True})
         try:
             response = client.ingest_event(event)
             # If there are no API keys in the system, unauthenticated access might be allowed
             print(f"Note: Unauthenticated access allowed - response: {response.success}")
         except AuthenticationError:
             print("Authentication error correctly raised for invalid API key")
-        except (HTTPStatusError, RemoteProtocolError) as e:
-            pytest.skip(f"Backend not available: {e}")
     finally:
         client.close()
 
 
 @pytest.mark.integration
-def test_structured_syslog_with_rfc_format():
+def test_structured_syslog_with_rfc_format(live_client):
     """Test ingesting syslog in structured format that mimics RFC3164."""
-    client = QuickSearchClient(base_url=BASE_URL, api_key=API_KEY)
-
     # Use structured data to simulate RFC3164 syslog
     # The backend expects JSON format for structured data
     syslog_data = {
@@ -192,31 +181,19 @@ def test_structured_syslog_with_rfc_format():
         }
     }
 
-    try:
-        response = client.ingest_syslog(syslog_data)
-        assert response.success is True
-        print(f"Structured syslog ingested with ID: {response.eventId}")
-    except (HTTPStatusError, RemoteProtocolError) as e:
-        pytest.skip(f"Backend not available: {e}")
-    finally:
-        client.close()
+    response = live_client.ingest_syslog(syslog_data)
+    assert response.success is True
+    print(f"Structured syslog ingested with ID: {response.eventId}")
 
 
 @pytest.mark.integration
 def test_context_manager():
     """Test using client as context manager."""
-    try:
-        with QuickSearchClient(base_url=BASE_URL, api_key=API_KEY) as client:
-            event = EventData(
-                type="context_test",
-                application="python_sdk",
-                data={"context": True},
-            )
-            response = client.ingest_event(event)
-            assert response.success is True
-            print(f"Context manager test passed with ID: {response.eventId}")
-    except (HTTPStatusError, RemoteProtocolError) as e:
-        pytest.skip(f"Backend not available: {e}")
+    with QuickSearchClient(base_url=BASE_URL, api_key=API_KEY) as client:
+        event = _make_event(type="context_test", data={"context": True})
+        response = client.ingest_event(event)
+        assert response.success is True
+        print(f"Context manager test passed with ID: {response.eventId}")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,54 @@
+"""
+Tests for JSON encoding helpers.
+"""
+
+import json
+from datetime import datetime, timezone
+from decimal import Decimal
+
+import pytest
+
+from quicksearch import _json
+from quicksearch.models import EventData
+
+
+def test_dumps_model_excludes_none():
+    """Test models are dumped without None fields."""
+    body = _json.dumps(EventData(type="test", data={"k": "v"}))
+    assert json.loads(body) == {"type": "test", "data": {"k": "v"}}
+
+
+def test_dumps_dict():
+    """Test plain dictionaries are dumped as compact JSON."""
+    ts = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    body = _json.dumps({"type": "test", "at": ts})
+    decoded = json.loads(body)
+    assert datetime.fromisoformat(decoded["at"].replace("Z", "+00:00")) == ts
+
+
+def test_dumps_falls_back_for_unsupported_types():
+    """Test types orjson rejects are still encoded."""
+    assert json.loads(_json.dumps({"value": Decimal("1.5")})) == {"value": "1.5"}
+
+
+@pytest.mark.parametrize("count", [0, 1, 3])
+def test_dumps_many(count):
+    """Test several items are encoded as one JSON array."""
+    events = [EventData(type=f"e{i}") for i in range(count)]
+    assert json.loads(_json.dumps_many(events)) == [
+        {"type": f"e{i}", "data": {}} for i in range(count)
+    ]
+
+
+def test_iter_many_matches_dumps_many():
+    """Test the streamed array body is identical to the buffered one."""
+    events = [EventData(type=f"e{i}", data={"i": i}) for i in range(50)]
+    chunks = list(_json.iter_many(events, chunk_size=256))
+    assert len(chunks) > 1
+    assert b"".join(chunks) == _json.dumps_many(events)
+
+
+def test_loads_roundtrip():
+    """Test response bodies are parsed back into Python objects."""
+    payload = {"success": True, "events": [{"id": 1}], "count": 1}
+    assert _json.loads(_json.dumps(payload)) == payload
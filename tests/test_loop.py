@@ -0,0 +1,18 @@
+"""
+Tests for event loop helpers.
+"""
+
+import sys
+
+import pytest
+
+from quicksearch import install_uvloop
+
+
+def test_install_uvloop_missing(monkeypatch):
+    """Test a helpful ImportError is raised when uvloop is unavailable."""
+    monkeypatch.setitem(sys.modules, "uvloop", None)
+
+    with pytest.raises(ImportError, match="uvloop is not installed"):
+        install_uvloop()
+
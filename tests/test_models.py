@@ -4,7 +4,13 @@ Tests for Pydantic models.
 
 import pytest
 
-from quicksearch.models import EventData, SyslogData, EventResponse, EventSearchResult
+from quicksearch.models import (
+    EventData,
+    EventDataFast,
+    EventResponse,
+    EventSearchResult,
+    SyslogData,
+)
 
 
 class TestEventData:
@@ -45,17 +51,46 @@ class TestEventData:
         with pytest.raises(ValueError, match="timestamp must be in ISO 8601 format"):
             EventData(type="test", timestamp="invalid-timestamp")
 
-    def test_valid_timestamp_formats(self):
-        """Test various valid ISO 8601 timestamp formats."""
-        valid_timestamps = [
+    @pytest.mark.parametrize(
+        "ts",
+        [
             "2024-01-01T00:00:00Z",
             "2024-01-01T00:00:00.123Z",
             "2024-01-01T00:00:00+00:00",
             "2024-01-01T00:00:00.123+00:00",
-        ]
-        for ts in valid_timestamps:
-            event = EventData(type="test", timestamp=ts)
-            assert event.timestamp == ts
+        ],
+    )
+    def test_valid_timestamp_formats(self, ts):
+        """Test various valid ISO 8601 timestamp formats."""
+        event = EventData(type="test", timestamp=ts)
+        assert event.timestamp == ts
+
+    def test_repeated_timestamp_is_parsed_once(self):
+        """Test a repeated timestamp string is validated from the parse cache."""
+        from quicksearch.models import _is_iso_timestamp
+
+        ts = "2024-06-01T12:00:00.5Z"
+        EventData(type="test", timestamp=ts)
+        hits = _is_iso_timestamp.cache_info().hits
+        EventData(type="test", timestamp=ts)
+
+        assert _is_iso_timestamp.cache_info().hits == hits + 1
+
+
+class TestEventDataFast:
+    """Tests for EventDataFast dataclass."""
+
+    def test_create_fast_event(self):
+        """Test the fast event skips validation and drops None fields on dump."""
+        event = EventDataFast(type="click", timestamp="not-validated")
+        assert event.model_dump() == {"type": "click", "timestamp": "not-validated"}
+
+    def test_fast_event_is_frozen(self):
+        """Test the fast event is immutable and has no instance dict."""
+        event = EventDataFast(type="click")
+        with pytest.raises(AttributeError):
+            event.type = "view"
+        assert not hasattr(event, "__dict__")
 
 
 class TestSyslogData:
@@ -104,6 +139,12 @@ class TestEventResponse:
         assert response.success is True
         assert response.eventId is None
 
+    def test_response_is_frozen(self):
+        """Test responses are immutable."""
+        response = EventResponse(success=True, message="OK")
+        with pytest.raises(ValueError):
+            response.success = False
+
 
 class TestEventSearchResult:
     """Tests for EventSearchResult model."""
@@ -137,3 +178,12 @@ class TestEventSearchResult:
         assert result.estimated_total is None
         assert result.processing_time_ms is None
         assert result.query is None
+
+    def test_events_list_is_kept_as_is(self):
+        """Test the events list is passed through without per-event validation."""
+        events = [{"id": str(i)} for i in range(3)]
+        result = EventSearchResult(success=True, events=events, count=3)
+        assert result.events is events
+
+        with pytest.raises(ValueError, match="events must be a list"):
+            EventSearchResult(success=True, events="nope", count=0)
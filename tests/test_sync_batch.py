@@ -2,6 +2,8 @@
 Tests for synchronous batch processing.
 """
 
+import gzip
+import json
 import time
 
 import httpx
@@ -15,10 +17,29 @@ from quicksearch import (
     EventResponse,
     QuickSearchClient,
 )
+from quicksearch.batch_processor import SyncBatchProcessor
+
+_EVENTS_URL = "http://localhost:3000/api/events"
+_BULK_URL = "http://localhost:3000/api/events/bulk"
+# respx clones reused responses per request, so these can be shared
+_BAD_REQUEST = httpx.Response(400, json={"statusMessage": "Bad request"})
+_SERVER_ERROR = httpx.Response(500, json={"statusMessage": "Server error"})
+_FAIL_MARK = b'"type":"fail_event"'
+
+# Options are frozen, so configurations used by several tests are built once
+_OPTS_DISABLED = BatchIngestOptions(enabled=False)
+# Large batches and a long interval: events only go out on close()
+_OPTS_FLUSH_ON_CLOSE = BatchIngestOptions(enabled=True, batch_size=100, flush_interval=60.0)
+_OPTS_ONE_RETRY = BatchIngestOptions(enabled=True, retry_attempts=1, retry_delay=0.1)
+
+
+def _make_events(n, data):
+    # model_construct skips validation; the fixture data is static and known-valid
+    return [EventData.model_construct(**data) for _ in range(n)]
 
 
 @respx.mock
-def test_ingest_events_with_batching_enabled(mock_event_data, mock_api_response):
+def test_ingest_events_with_batching_enabled(mock_event_data, mock_201):
     """Test batch ingestion with batching enabled returns BatchIngestResult."""
     client = QuickSearchClient(
         api_key="test-api-key",
@@ -30,11 +51,9 @@ def test_ingest_events_with_batching_enabled(mock_event_data, mock_api_response)
     )
 
     # Mock the API endpoint
-    respx.post("http://localhost:3000/api/events").mock(
-        return_value=httpx.Response(201, json=mock_api_response)
-    )
+    respx.post(_EVENTS_URL).mock(return_value=mock_201)
 
-    events = [EventData(**mock_event_data) for _ in range(10)]
+    events = _make_events(10, mock_event_data)
     result = client.ingest_events(events)
 
     assert isinstance(result, BatchIngestResult)
@@ -44,19 +63,17 @@ def test_ingest_events_with_batching_enabled(mock_event_data, mock_api_response)
 
 
 @respx.mock
-def test_ingest_events_with_batching_disabled(mock_event_data, mock_api_response):
+def test_ingest_events_with_batching_disabled(mock_event_data, mock_201):
     """Test that batching can be disabled (default behavior)."""
     client = QuickSearchClient(
         api_key="test-api-key",
-        batch_options=BatchIngestOptions(enabled=False),
+        batch_options=_OPTS_DISABLED,
     )
 
     # Mock the API endpoint
-    respx.post("http://localhost:3000/api/events").mock(
-        return_value=httpx.Response(201, json=mock_api_response)
-    )
+    respx.post(_EVENTS_URL).mock(return_value=mock_201)
 
-    events = [EventData(**mock_event_data) for _ in range(3)]
+    events = _make_events(3, mock_event_data)
     responses = client.ingest_events(events)
 
     # Should return list of EventResponse (backward compatible)
@@ -66,20 +83,18 @@ def test_ingest_events_with_batching_disabled(mock_event_data, mock_api_response
 
 
 @respx.mock
-def test_ingest_events_with_batch_options_override(mock_event_data, mock_api_response):
+def test_ingest_events_with_batch_options_override(mock_event_data, mock_201):
     """Test per-call batch options override."""
     # Client with batching disabled
     client = QuickSearchClient(
         api_key="test-api-key",
-        batch_options=BatchIngestOptions(enabled=False),
+        batch_options=_OPTS_DISABLED,
     )
 
     # Mock the API endpoint
-    respx.post("http://localhost:3000/api/events").mock(
-        return_value=httpx.Response(201, json=mock_api_response)
-    )
+    respx.post(_EVENTS_URL).mock(return_value=mock_201)
 
-    events = [EventData(**mock_event_data) for _ in range(5)]
+    events = _make_events(5, mock_event_data)
 
     # Call with batching enabled via override
     result = client.ingest_events(
@@ -96,16 +111,9 @@ def test_ingest_events_with_batch_options_override(mock_event_data, mock_api_res
 
 
 @respx.mock
-def test_ingest_event_batched_queuing(mock_event_data, mock_api_response):
+def test_ingest_event_batched_queuing(event_model, mock_201):
     """Test queuing events with ingest_event_batched."""
-    call_count = 0
-
-    def mock_response(request):
-        nonlocal call_count
-        call_count += 1
-        return httpx.Response(201, json=mock_api_response)
-
-    respx.post("http://localhost:3000/api/events").mock(side_effect=mock_response)
+    route = respx.post(_EVENTS_URL).mock(return_value=mock_201)
 
     client = QuickSearchClient(
         api_key="test-api-key",
@@ -119,83 +127,59 @@ def test_ingest_event_batched_queuing(mock_event_data, mock_api_response):
     try:
         # Queue events
         for _ in range(3):
-            event = EventData(**mock_event_data)
-            client.ingest_event_batched(event)
-
-        # Force flush
-        client.flush_batch()
+            client.ingest_event_batched(event_model)
 
-        # Give time for flush to complete
-        time.sleep(0.5)
+        # Flush and wait for the background thread to send the batch
+        assert client.wait_for_flush(timeout=5.0)
 
-        assert call_count == 3
+        assert route.call_count == 3
     finally:
         client.close()
 
 
 @respx.mock
-def test_ingest_event_batched_when_disabled(mock_event_data):
+def test_ingest_event_batched_when_disabled(event_model):
     """Test ingest_event_batched raises error when batching is disabled."""
     client = QuickSearchClient(
         api_key="test-api-key",
-        batch_options=BatchIngestOptions(enabled=False),
+        batch_options=_OPTS_DISABLED,
     )
 
-    event = EventData(**mock_event_data)
-
     with pytest.raises(RuntimeError, match="Batching is not enabled"):
-        client.ingest_event_batched(event)
+        client.ingest_event_batched(event_model)
 
 
 @respx.mock
-def test_batch_processor_auto_flush_on_close(mock_event_data, mock_api_response):
+def test_batch_processor_auto_flush_on_close(event_model, mock_201):
     """Test that batch processor flushes on close."""
-    call_count = 0
-
-    def mock_response(request):
-        nonlocal call_count
-        call_count += 1
-        return httpx.Response(201, json=mock_api_response)
-
-    respx.post("http://localhost:3000/api/events").mock(side_effect=mock_response)
+    route = respx.post(_EVENTS_URL).mock(return_value=mock_201)
 
     with QuickSearchClient(
         api_key="test-api-key",
-        batch_options=BatchIngestOptions(
-            enabled=True,
-            batch_size=100,  # Large batch size
-            flush_interval=60.0,  # Long interval
-        ),
+        batch_options=_OPTS_FLUSH_ON_CLOSE,
     ) as client:
         # Queue a few events (not enough to trigger batch size)
         for _ in range(3):
-            event = EventData(**mock_event_data)
-            client.ingest_event_batched(event)
+            client.ingest_event_batched(event_model)
 
         # Events should be flushed on context exit
-        assert call_count == 0
+        assert route.call_count == 0
 
-    # After close, events should be flushed
-    time.sleep(0.5)
-    assert call_count == 3
+    # close() blocks until the remaining events are flushed
+    assert route.call_count == 3
 
 
 @respx.mock
-def test_concurrent_batch_ingestion_with_retries(mock_event_data, mock_api_response):
+def test_concurrent_batch_ingestion_with_retries(mock_event_data, mock_201):
     """Test concurrent batch ingestion with retry logic."""
-    call_count = 0
-    fail_count = 0
 
-    def mock_response(request):
-        nonlocal call_count, fail_count
-        call_count += 1
-        # Simulate every 3rd request failing
-        if call_count % 3 == 0:
-            fail_count += 1
-            return httpx.Response(500, json={"statusMessage": "Server error"})
-        return httpx.Response(201, json=mock_api_response)
+    def mock_response(request, route):
+        # Simulate every 3rd request failing; respx counts calls before this one
+        if route.call_count % 3 == 2:
+            return _SERVER_ERROR
+        return mock_201
 
-    respx.post("http://localhost:3000/api/events").mock(side_effect=mock_response)
+    respx.post(_EVENTS_URL).mock(side_effect=mock_response)
 
     client = QuickSearchClient(
         api_key="test-api-key",
@@ -208,7 +192,7 @@ def test_concurrent_batch_ingestion_with_retries(mock_event_data, mock_api_respo
         ),
     )
 
-    events = [EventData(**mock_event_data) for _ in range(9)]
+    events = _make_events(9, mock_event_data)
     result = client.ingest_events(events)
 
     assert isinstance(result, BatchIngestResult)
@@ -218,20 +202,17 @@ def test_concurrent_batch_ingestion_with_retries(mock_event_data, mock_api_respo
 
 
 @respx.mock
-def test_batch_ingest_partial_success(mock_event_data, mock_api_response):
+def test_batch_ingest_partial_success(mock_event_data, mock_201):
     """Test batch ingestion with partial success."""
-    def mock_response(request):
-        # Fail events with odd index (simulated by checking request body)
-        import json
 
-        body = json.loads(request.content)
-        event_type = body.get("type", "")
-        if "fail" in event_type:
-            return httpx.Response(400, json={"statusMessage": "Bad request"})
+    def mock_response(request):
+        # Fail events with odd index; bodies are compact JSON, so a byte scan suffices
+        if _FAIL_MARK in request.content:
+            return _BAD_REQUEST
 
-        return httpx.Response(201, json=mock_api_response)
+        return mock_201
 
-    respx.post("http://localhost:3000/api/events").mock(side_effect=mock_response)
+    respx.post(_EVENTS_URL).mock(side_effect=mock_response)
 
     client = QuickSearchClient(
         api_key="test-api-key",
@@ -243,12 +224,11 @@ def test_batch_ingest_partial_success(mock_event_data, mock_api_response):
     )
 
     # Create mix of success and failure events
-    events = []
-    for i in range(10):
-        event_data = mock_event_data.copy()
-        if i % 2 == 1:
-            event_data["type"] = "fail_event"
-        events.append(EventData(**event_data))
+    base = EventData.model_construct(**mock_event_data)
+    events = [
+        base.model_copy(update={"type": "fail_event"}) if i % 2 == 1 else base.model_copy()
+        for i in range(10)
+    ]
 
     result = client.ingest_events(events)
 
@@ -268,3 +248,278 @@ def test_batch_ingest_result_success_rate():
     )
 
     assert result.success_rate == 75.0
+
+
+@respx.mock
+def test_batched_flush_uses_bulk_endpoint(event_model):
+    """Test queued events are flushed as one bulk request when configured."""
+    route = respx.post(_BULK_URL).mock(
+        return_value=httpx.Response(201, json={"success": True, "message": "ok"})
+    )
+
+    with QuickSearchClient(
+        api_key="test-api-key",
+        bulk_ingest_path="/api/events/bulk",
+        batch_options=_OPTS_FLUSH_ON_CLOSE,
+    ) as client:
+        for _ in range(3):
+            client.ingest_event_batched(event_model)
+
+    assert route.call_count == 1
+    assert len(json.loads(route.calls.last.request.content)) == 3
+
+
+@respx.mock
+def test_bulk_body_is_gzip_compressed(event_model):
+    """Test large bulk bodies are compressed when compression is enabled."""
+    route = respx.post(_BULK_URL).mock(
+        return_value=httpx.Response(201, json={"success": True, "message": "ok"})
+    )
+
+    client = QuickSearchClient(
+        api_key="test-api-key",
+        bulk_ingest_path="/api/events/bulk",
+        batch_options=BatchIngestOptions(compression="gzip"),
+    )
+    client._ingest_batch_internal([event_model] * 200)
+
+    request = route.calls.last.request
+    assert request.headers["Content-Encoding"] == "gzip"
+    assert len(json.loads(gzip.decompress(request.content))) == 200
+
+
+@respx.mock
+def test_bulk_compression_from_call_options(event_model):
+    """Test compression passed to ingest_events applies over the client default."""
+    route = respx.post(_BULK_URL).mock(
+        return_value=httpx.Response(201, json={"success": True, "message": "ok"})
+    )
+
+    client = QuickSearchClient(api_key="test-api-key", bulk_ingest_path="/api/events/bulk")
+    client.ingest_events(
+        [event_model] * 200,
+        batch_options=BatchIngestOptions(enabled=True, batch_size=200, compression="gzip"),
+    )
+
+    assert route.calls.last.request.headers["Content-Encoding"] == "gzip"
+
+
+def test_batch_processor_add_event_when_full(event_model):
+    """Test add_event signals a flush at batch_size and reports a full queue."""
+    processor = SyncBatchProcessor(
+        ingest_func=lambda batch: [],
+        options=BatchIngestOptions(batch_size=100, queue_size_limit=100),
+    )
+
+    for _ in range(100):
+        assert processor.add_event(event_model)
+
+    assert processor._flush_event.is_set()
+    assert processor.add_event(event_model, timeout=0.01) is False
+
+
+def test_batch_processor_single_flusher(event_model):
+    """Test a flush is skipped while another flush is draining the queue."""
+    batches = []
+    processor = SyncBatchProcessor(
+        ingest_func=lambda batch: batches.append(batch) or [],
+        options=BatchIngestOptions(batch_size=10),
+    )
+    processor.add_event(event_model)
+
+    with processor._flush_lock:
+        # Producers are not blocked by the drain in progress
+        assert processor.add_event(event_model, timeout=0.01)
+        processor._flush_batch()
+        assert batches == []
+
+    processor._flush_batch()
+    assert len(batches) == 1 and len(batches[0]) == 2
+
+
+@respx.mock
+def test_ingest_events_bulk_chunks_by_batch_size(mock_event_data):
+    """Test ingest_events_bulk sends one request per batch_size chunk."""
+    route = respx.post(_BULK_URL).mock(
+        return_value=httpx.Response(
+            201, json={"success": True, "results": [{"index": 1, "success": False, "error": "bad"}]}
+        )
+    )
+
+    client = QuickSearchClient(api_key="test-api-key", bulk_ingest_path="/api/events/bulk")
+    result = client.ingest_events_bulk(
+        [mock_event_data] * 5, batch_options=BatchIngestOptions(batch_size=2)
+    )
+
+    assert route.call_count == 3
+    assert result.batch_count == 3
+    assert result.success_count == 3
+    assert sorted(error.event_index for error in result.errors) == [1, 3]
+
+
+@respx.mock
+def test_bulk_falls_back_when_endpoint_missing(mock_event_data, mock_201):
+    """Test a 404 from the bulk endpoint switches the client to per-event POSTs."""
+    bulk = respx.post(_BULK_URL).mock(
+        return_value=httpx.Response(404, json={"statusMessage": "Not found"})
+    )
+    single = respx.post(_EVENTS_URL).mock(return_value=mock_201)
+
+    client = QuickSearchClient(api_key="test-api-key", bulk_ingest_path="/api/events/bulk")
+    first = client.ingest_events([mock_event_data] * 2)
+    second = client.ingest_events([mock_event_data] * 2)
+
+    assert all(response.success for response in first + second)
+    assert bulk.call_count == 1
+    assert single.call_count == 4
+
+
+@respx.mock
+def test_bulk_fallback_sends_each_event_once(mock_201):
+    """Test a failed event in the per-event fallback does not re-send the others."""
+    respx.post(_BULK_URL).mock(return_value=httpx.Response(404, json={}))
+
+    def respond(request):
+        if json.loads(request.content)["type"] == "e1":
+            return _BAD_REQUEST
+        return mock_201
+
+    single = respx.post(_EVENTS_URL).mock(side_effect=respond)
+
+    with QuickSearchClient(api_key="test-api-key", bulk_ingest_path="/api/events/bulk") as client:
+        result = client.ingest_events(
+            [EventData(type=f"e{i}") for i in range(3)],
+            batch_options=BatchIngestOptions(enabled=True, retry_attempts=2, retry_delay=0.1),
+        )
+
+    sent = sorted(json.loads(call.request.content)["type"] for call in single.calls)
+    assert sent == ["e0", "e1", "e2"]
+    assert (result.success_count, [error.event_index for error in result.errors]) == (2, [1])
+
+
+@respx.mock
+def test_retries_reuse_encoded_body(mock_201, monkeypatch):
+    """Test an event is encoded once even when it is retried."""
+    from quicksearch import EventDataFast, _json
+
+    responses = iter([httpx.Response(503, json={"statusMessage": "Unavailable"})])
+    respx.post(_EVENTS_URL).mock(
+        side_effect=lambda request: next(responses, mock_201)
+    )
+
+    encoded = []
+    real_dumps = _json.dumps
+    monkeypatch.setattr(_json, "dumps", lambda obj: encoded.append(obj) or real_dumps(obj))
+
+    client = QuickSearchClient(api_key="test-api-key")
+    result = client.ingest_events(
+        [EventDataFast(type="click"), EventDataFast(type="view")],
+        batch_options=_OPTS_ONE_RETRY,
+    )
+
+    assert result.success_count == 2
+    assert sum(isinstance(obj, EventDataFast) for obj in encoded) == 2
+
+
+@respx.mock
+def test_retries_failed_events_in_one_round(mock_event_data, mock_201, monkeypatch):
+    """Test retryable failures share a single jittered backoff sleep per round."""
+
+    def mock_response(request, route):
+        # The first six calls fail; respx counts calls before this one
+        if route.call_count < 6:
+            return httpx.Response(503, json={"statusMessage": "Unavailable"})
+        return mock_201
+
+    respx.post(_EVENTS_URL).mock(side_effect=mock_response)
+
+    sleeps = []
+    monkeypatch.setattr(time, "sleep", sleeps.append)
+
+    client = QuickSearchClient(api_key="test-api-key")
+    result = client.ingest_events(
+        _make_events(6, mock_event_data),
+        batch_options=BatchIngestOptions(enabled=True, retry_attempts=2, retry_delay=0.5),
+    )
+
+    assert result.success_count == 6
+    assert len(sleeps) == 1
+    assert 0.25 <= sleeps[0] <= 0.75
+
+
+@respx.mock
+def test_retry_waits_for_retry_after(event_model, mock_201, monkeypatch):
+    """Test a Retry-After header lengthens the backoff before the next round."""
+    responses = iter(
+        [httpx.Response(429, json={"statusMessage": "Slow down"}, headers={"Retry-After": "3"})]
+    )
+    respx.post(_EVENTS_URL).mock(
+        side_effect=lambda request: next(responses, mock_201)
+    )
+
+    sleeps = []
+    monkeypatch.setattr(time, "sleep", sleeps.append)
+
+    client = QuickSearchClient(api_key="test-api-key")
+    result = client.ingest_events(
+        [event_model],
+        batch_options=BatchIngestOptions(enabled=True, retry_attempts=1, retry_delay=2.0),
+    )
+
+    assert result.success_count == 1
+    assert sleeps == [3.0]
+
+
+@respx.mock
+def test_retry_after_beyond_schedule_is_not_retried(event_model, mock_201, monkeypatch):
+    """Test a Retry-After longer than the retry schedule fails the event instead."""
+    responses = iter(
+        [httpx.Response(503, json={"statusMessage": "Down"}, headers={"Retry-After": "86400"})]
+    )
+    route = respx.post(_EVENTS_URL).mock(side_effect=lambda request: next(responses, mock_201))
+
+    sleeps = []
+    monkeypatch.setattr(time, "sleep", sleeps.append)
+
+    with QuickSearchClient(api_key="test-api-key") as client:
+        result = client.ingest_events([event_model], batch_options=_OPTS_ONE_RETRY)
+
+    assert (result.failure_count, route.call_count, sleeps) == (1, 1, [])
+    assert result.errors[0].retry_after == 86400.0
+
+
+def test_parse_retry_after():
+    """Test Retry-After parsing for delay-seconds, HTTP-dates and junk."""
+    from datetime import datetime, timedelta, timezone
+    from email.utils import format_datetime
+
+    from quicksearch.client import parse_retry_after
+
+    assert parse_retry_after("120") == 120.0
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("soon") is None
+
+    later = format_datetime(datetime.now(timezone.utc) + timedelta(seconds=30), usegmt=True)
+    assert 25 <= parse_retry_after(later) <= 30
+
+
+@respx.mock
+def test_stored_errors_are_capped(mock_event_data):
+    """Test only max_errors_stored errors are kept and the rest reach the callback."""
+    respx.post(_EVENTS_URL).mock(
+        return_value=httpx.Response(400, json={"statusMessage": "Bad event"})
+    )
+
+    overflow = []
+    client = QuickSearchClient(api_key="test-api-key")
+    result = client.ingest_events(
+        _make_events(5, mock_event_data),
+        batch_options=BatchIngestOptions(
+            enabled=True, max_errors_stored=2, error_callback=overflow.append
+        ),
+    )
+
+    assert result.failure_count == 5
+    assert len(result.errors) == 2
+    assert result.errors_truncated is True
+    assert len(overflow) == 3
@@ -3,122 +3,98 @@ Tests for the synchronous QuickSearch client.
 """
 
 import json
+import re
+import socket
+import time
 
 import httpx
+import pydantic
 import pytest
-import respx
 
 from quicksearch import (
     AuthenticationError,
+    BatchIngestOptions,
     EventData,
-    EventResponse,
-    EventSearchResult,
+    EventDataFast,
     QuickSearchClient,
-    QuickSearchError,
     SyslogData,
     ValidationError,
 )
 
+_VALIDATION_RE = re.compile("Event type is required")
+_AUTH_RE = re.compile("Invalid API key")
 
-@respx.mock
-def test_ingest_event_success(mock_event_data, mock_api_response):
-    """Test successful event ingestion."""
-    client = QuickSearchClient(api_key="test-api-key")
 
+@pytest.mark.parametrize(
+    "make_event", [lambda data: data, lambda data: EventData(**data)], ids=["dict", "model"]
+)
+def test_ingest_event_success(client, make_event, mock_event_data, mock_201, respx_mock):
+    """Test successful event ingestion from a dictionary or an EventData model."""
     # Mock the API endpoint
-    route = respx.post(
-        "http://localhost:3000/api/events",
-        params={"api_key": "test-api-key"},
-    ).mock(return_value=httpx.Response(201, json=mock_api_response))
-
-    # Test with EventData model
-    event = EventData(**mock_event_data)
-    response = client.ingest_event(event)
-
-    assert response.success is True
-    assert response.eventId == "1704067200000-abc123"
-    assert route.called
-
+    route = respx_mock["ingest"].mock(return_value=mock_201)
 
-@respx.mock
-def test_ingest_event_with_dict(mock_event_data, mock_api_response):
-    """Test event ingestion with dictionary input."""
-    client = QuickSearchClient(api_key="test-api-key")
+    response = client.ingest_event(make_event(mock_event_data))
 
-    # Mock the API endpoint
-    respx.post("http://localhost:3000/api/events").mock(
-        return_value=httpx.Response(201, json=mock_api_response)
+    api_key = route.calls.last.request.url.params["api_key"]
+    assert (response.success, response.eventId, api_key) == (
+        True,
+        "1704067200000-abc123",
+        "test-api-key",
     )
 
-    # Test with dictionary
-    response = client.ingest_event(mock_event_data)
-
-    assert response.success is True
-    assert response.eventId == "1704067200000-abc123"
 
+def test_ingest_event_sends_current_data(client, mock_201, respx_mock):
+    """Test in-place changes to an event's data are sent on the next ingest."""
+    route = respx_mock["ingest"].mock(return_value=mock_201)
+    event = EventData(type="test", data={"n": 0})
 
-@respx.mock
-def test_ingest_event_validation_error(mock_event_data):
-    """Test event validation error handling."""
-    client = QuickSearchClient(api_key="test-api-key")
+    client.ingest_event(event)
+    event.data["n"] = 1
+    client.ingest_event(event)
 
-    # Mock the API endpoint to return 400
-    respx.post("http://localhost:3000/api/events").mock(
-        return_value=httpx.Response(
-            400,
-            json={"statusMessage": "Event type is required"},
-        )
-    )
-
-    with pytest.raises(ValidationError, match="Event type is required"):
-        client.ingest_event(mock_event_data)
+    assert json.loads(route.calls.last.request.content)["data"] == {"n": 1}
 
 
-@respx.mock
-def test_ingest_event_authentication_error(mock_event_data):
-    """Test authentication error handling."""
-    client = QuickSearchClient(api_key="invalid-key")
-
-    # Mock the API endpoint to return 401
-    respx.post("http://localhost:3000/api/events").mock(
-        return_value=httpx.Response(
-            401,
-            json={"statusMessage": "Invalid API key"},
-        )
-    )
+@pytest.mark.parametrize(
+    ("status", "body", "exc", "match"),
+    [
+        (
+            400,
+            {"statusMessage": "Event type is required"},
+            ValidationError,
+            _VALIDATION_RE,
+        ),
+        (401, {"statusMessage": "Invalid API key"}, AuthenticationError, _AUTH_RE),
+    ],
+    ids=["validation", "authentication"],
+)
+def test_ingest_event_error(client, status, body, exc, match, mock_event_data, respx_mock):
+    """Test error statuses are raised as the matching exception."""
+    respx_mock["ingest"].mock(return_value=httpx.Response(status, json=body))
 
-    with pytest.raises(AuthenticationError, match="Invalid API key"):
+    with pytest.raises(exc, match=match):
         client.ingest_event(mock_event_data)
 
 
-@respx.mock
-def test_search_events(mock_search_response):
+def test_search_events(client, mock_search_200, respx_mock):
     """Test event search."""
-    client = QuickSearchClient(api_key="test-api-key")
-
     # Mock the API endpoint
-    respx.get("http://localhost:3000/api/events").mock(
-        return_value=httpx.Response(200, json=mock_search_response)
-    )
+    respx_mock["search"].mock(return_value=mock_search_200)
 
     result = client.search_events(query="user_login", limit=10)
 
-    assert result.success is True
-    assert result.count == 1
-    assert result.estimated_total == 1
-    assert len(result.events) == 1
-    assert result.events[0]["type"] == "user_login"
+    assert (
+        result.success,
+        result.count,
+        result.estimated_total,
+        [event["type"] for event in result.events],
+    ) == (True, 1, 1, ["user_login"])
 
 
-@respx.mock
-def test_search_events_with_filters(mock_search_response):
+def test_search_events_with_filters(client, mock_search_200, respx_mock):
     """Test event search with filters."""
-    client = QuickSearchClient(api_key="test-api-key")
-
     # Mock the API endpoint
-    route = respx.get("http://localhost:3000/api/events").mock(
-        return_value=httpx.Response(200, json=mock_search_response)
-    )
+    route = respx_mock["search"].mock(return_value=mock_search_200)
 
     result = client.search_events(
         query="error",
@@ -127,73 +103,280 @@ def test_search_events_with_filters(mock_search_response):
         limit=50,
     )
 
-    assert result.success is True
-    # Verify the request was made with the correct params
-    assert route.called
+    # Verify the request was made
+    assert (result.success, route.called) == (True, True)
 
 
-@respx.mock
-def test_ingest_syslog_structured(mock_syslog_data, mock_api_response):
-    """Test syslog ingestion with structured data."""
-    client = QuickSearchClient(api_key="test-api-key")
-
+@pytest.mark.parametrize(
+    "make_syslog",
+    [
+        lambda data: SyslogData(**data),
+        lambda data: "<34>Oct 11 22:14:15 mymachine su: 'su root' failed for user",
+    ],
+    ids=["structured", "raw"],
+)
+def test_ingest_syslog(client, make_syslog, mock_syslog_data, mock_201, respx_mock):
+    """Test syslog ingestion with structured data or a raw syslog string."""
     # Mock the API endpoint
-    respx.post("http://localhost:3000/api/syslog").mock(
-        return_value=httpx.Response(201, json=mock_api_response)
-    )
+    respx_mock["syslog"].mock(return_value=mock_201)
 
-    # Test with SyslogData model
-    syslog = SyslogData(**mock_syslog_data)
-    response = client.ingest_syslog(syslog)
+    response = client.ingest_syslog(make_syslog(mock_syslog_data))
 
-    assert response.success is True
-    assert response.eventId == "1704067200000-abc123"
+    assert (response.success, response.eventId) == (True, "1704067200000-abc123")
 
 
-@respx.mock
-def test_ingest_syslog_raw_string(mock_api_response):
-    """Test syslog ingestion with raw string."""
-    client = QuickSearchClient(api_key="test-api-key")
+@pytest.mark.parametrize("count", [1, 3, 10, 100])
+def test_ingest_events_batch(client, count, event_model, mock_201, respx_mock):
+    """Test batch event ingestion."""
+    route = respx_mock["ingest"].mock(return_value=mock_201)
 
-    # Mock the API endpoint
-    respx.post("http://localhost:3000/api/syslog").mock(
-        return_value=httpx.Response(201, json=mock_api_response)
+    responses = client.ingest_events([event_model] * count)
+
+    assert ([r.success for r in responses], route.call_count) == ([True] * count, count)
+
+
+@pytest.mark.parametrize("use_context", [True, False], ids=["context_manager", "close"])
+def test_lifecycle_closes_client(use_context, monkeypatch):
+    """Test leaving the context manager or calling close() closes the httpx client."""
+    # A mock transport skips building a real connection pool for a lifecycle-only test
+    transport = httpx.MockTransport(lambda request: httpx.Response(204))
+    monkeypatch.setattr(
+        QuickSearchClient, "_build_client", lambda self: httpx.Client(transport=transport)
     )
 
-    # Test with raw syslog string
-    raw_syslog = "<34>Oct 11 22:14:15 mymachine su: 'su root' failed for user"
-    response = client.ingest_syslog(raw_syslog)
+    if use_context:
+        with QuickSearchClient(api_key="test-api-key") as client:
+            assert client.auth.api_key == "test-api-key"
+    else:
+        client = QuickSearchClient(api_key="test-api-key")
+        client.close()
 
-    assert response.success is True
+    assert client._client.is_closed
 
 
-@respx.mock
-def test_ingest_events_batch(mock_event_data, mock_api_response):
-    """Test batch event ingestion."""
+def test_client_usable_after_close(mock_event_data, mock_201, respx_mock):
+    """Test a closed client rebuilds its httpx client on the next request."""
+    route = respx_mock["ingest"].mock(return_value=mock_201)
     client = QuickSearchClient(api_key="test-api-key")
+    client.close()
 
-    # Mock the API endpoint
-    respx.post("http://localhost:3000/api/events").mock(
-        return_value=httpx.Response(201, json=mock_api_response)
-    )
+    assert client.ingest_event(mock_event_data).success
+    assert route.call_count == 1
+    client.close()
+
+
+def test_ingest_events_raw(client, mock_event_data, mock_201, respx_mock):
+    """Test raw dictionary ingestion skips model construction."""
+    route = respx_mock["ingest"].mock(return_value=mock_201)
 
-    events = [EventData(**mock_event_data) for _ in range(3)]
-    responses = client.ingest_events(events)
+    responses = client.ingest_events_raw([mock_event_data, mock_event_data])
 
-    assert len(responses) == 3
+    assert len(responses) == 2
     assert all(r.success for r in responses)
+    assert json.loads(route.calls.last.request.content) == mock_event_data
 
 
-def test_context_manager():
-    """Test client as context manager."""
+def test_ingest_events_fast(client, mock_201, respx_mock):
+    """Test EventDataFast instances are sent without None fields."""
+    route = respx_mock["ingest"].mock(return_value=mock_201)
+
+    responses = client.ingest_events([EventDataFast(type="click", data={"i": 1})] * 2)
+
+    assert len(responses) == 2
+    assert json.loads(route.calls.last.request.content) == {"type": "click", "data": {"i": 1}}
+
+
+def test_connection_pool_sized_for_concurrency():
+    """Test the keepalive pool holds one connection per concurrent worker."""
+    with QuickSearchClient(
+        api_key="test-api-key",
+        batch_options=BatchIngestOptions(max_concurrency=8, burst_limit=16),
+    ) as client:
+        assert client._limits.max_keepalive_connections == 16
+        assert client._limits.max_connections == 16
+
+
+def test_http2_keeps_one_connection():
+    """Test HTTP/2 relies on multiplexing rather than parallel kept-alive sockets."""
+    pytest.importorskip("h2")
+    client = QuickSearchClient(api_key="test-api-key", http2=True)
+
+    assert client._limits.max_keepalive_connections == 1
+    client.close()
+
+
+def test_keepalive_spans_flush_interval():
+    """Test idle connections are kept for longer than the batch flush interval."""
+    with QuickSearchClient(
+        api_key="test-api-key", batch_options=BatchIngestOptions(flush_interval=10.0)
+    ) as client:
+        assert client._limits.keepalive_expiry == 20.0
     with QuickSearchClient(api_key="test-api-key") as client:
-        assert client is not None
-        assert client.auth.api_key == "test-api-key"
-    # Session should be closed after exiting context
+        assert client._limits.keepalive_expiry == 5.0
 
 
-def test_close():
-    """Test closing the client."""
+def test_transport_sets_socket_options():
+    """Test the pooled transport disables Nagle and enables TCP keepalive."""
     client = QuickSearchClient(api_key="test-api-key")
+    pool = client.client._transport._pool
+
+    assert (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1) in pool._socket_options
+    assert (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1) in pool._socket_options
     client.close()
-    # Should not raise any exception
+
+
+def test_env_proxy_is_honoured(monkeypatch):
+    """Test HTTP_PROXY from the environment still routes requests through the proxy."""
+    monkeypatch.setenv("HTTP_PROXY", "http://proxy.local:8080")
+    client = QuickSearchClient(api_key="test-api-key")
+
+    assert client.client._mounts
+    client.close()
+
+
+def test_search_events_skips_none_params(client, mock_search_200, respx_mock):
+    """Test unset filters and None kwargs are left out of the query string."""
+    route = respx_mock["search"].mock(return_value=mock_search_200)
+
+    client.search_events(query="error", severity=None, application="web", page=None)
+
+    assert dict(route.calls.last.request.url.params) == {
+        "q": "error",
+        "limit": "100",
+        "application": "web",
+        "api_key": "test-api-key",
+    }
+
+
+def test_validate_responses_opt_in(mock_api_response, respx_mock):
+    """Test responses are trusted by default and validated only on request."""
+    respx_mock["ingest"].mock(
+        return_value=httpx.Response(201, json={**mock_api_response, "success": "maybe"})
+    )
+
+    with QuickSearchClient(api_key="test-api-key") as client:
+        assert client.ingest_event({"type": "click"}).success == "maybe"
+
+    with QuickSearchClient(api_key="test-api-key", validate_responses=True) as client:
+        with pytest.raises(pydantic.ValidationError):
+            client.ingest_event({"type": "click"})
+
+
+def test_auth_config_caches_views():
+    """Test auth headers are built once and rebuilt when credentials change."""
+    with QuickSearchClient(api_key="test-api-key") as client:
+        auth = client.auth
+
+        assert auth.get_headers() is auth.get_headers()
+        assert dict(auth.get_headers()) == {"Authorization": "Bearer test-api-key"}
+
+        auth.api_key = None
+        auth.jwt_token = "jwt"
+
+        assert client._json_headers[b"Authorization"] == b"Bearer jwt"
+        assert client._auth_params == {}
+
+
+def test_auth_change_applies_to_next_request(mock_event_data, mock_201, respx_mock):
+    """Test setting client.auth.api_key is used by the next request without a refresh."""
+    route = respx_mock["ingest"].mock(return_value=mock_201)
+
+    with QuickSearchClient(api_key="old-key") as client:
+        client.auth.api_key = "new-key"
+        client.ingest_event(mock_event_data)
+
+    request = route.calls.last.request
+    assert (request.headers["Authorization"], request.url.params["api_key"]) == (
+        "Bearer new-key",
+        "new-key",
+    )
+
+
+def test_custom_limits():
+    """Test an explicit httpx.Limits overrides the concurrency-based pool size."""
+    limits = httpx.Limits(max_keepalive_connections=20, max_connections=100)
+    client = QuickSearchClient(api_key="test-api-key", limits=limits)
+
+    assert client._limits is limits
+    assert client.client._transport._pool._max_connections == 100
+    client.close()
+
+
+def test_ingest_events_parallel_keeps_order(respx_mock):
+    """Test concurrent per-event ingestion returns responses in input order."""
+
+    def respond(request: httpx.Request) -> httpx.Response:
+        event_type = json.loads(request.content)["type"]
+        return httpx.Response(201, json={"success": True, "message": "ok", "eventId": event_type})
+
+    respx_mock["ingest"].mock(side_effect=respond)
+
+    with QuickSearchClient(
+        api_key="test-api-key", batch_options=BatchIngestOptions(max_concurrency=4)
+    ) as client:
+        responses = client.ingest_events([{"type": f"e{i}"} for i in range(20)])
+
+    assert [response.eventId for response in responses] == [f"e{i}" for i in range(20)]
+
+
+def test_ingest_events_parallel_stops_after_failure(mock_201, respx_mock):
+    """Test events not yet started are cancelled once a concurrent send fails."""
+
+    def respond(request: httpx.Request) -> httpx.Response:
+        if json.loads(request.content)["type"] == "e0":
+            return httpx.Response(400, json={"statusMessage": "Event type is required"})
+        time.sleep(0.01)
+        return mock_201
+
+    route = respx_mock["ingest"].mock(side_effect=respond)
+
+    with QuickSearchClient(
+        api_key="test-api-key", batch_options=BatchIngestOptions(max_concurrency=2)
+    ) as client:
+        with pytest.raises(ValidationError, match=_VALIDATION_RE):
+            client.ingest_events([{"type": f"e{i}"} for i in range(20)])
+
+    assert route.call_count < 20
+
+
+def test_ingest_syslog_dict_without_validation(client, mock_syslog_data, mock_201, respx_mock):
+    """Test validate=False sends a syslog dictionary exactly as given."""
+    route = respx_mock["syslog"].mock(return_value=mock_201)
+
+    response = client.ingest_syslog(mock_syslog_data, validate=False)
+
+    assert response.success is True
+    assert json.loads(route.calls.last.request.content) == mock_syslog_data
+
+
+def test_share_pool_reuses_client():
+    """Test share_pool instances reuse one httpx client that close() leaves open."""
+    first = QuickSearchClient(api_key="key-a", share_pool=True)
+    second = QuickSearchClient(api_key="key-b", share_pool=True)
+
+    assert first.client is second.client
+    first.close()
+    assert not second.client.is_closed
+
+    QuickSearchClient.shutdown_all()
+    assert second._client.is_closed
+
+
+def test_ingest_event_without_validation(client, mock_201, respx_mock):
+    """Test validate=False sends a dictionary without building EventData."""
+    route = respx_mock["ingest"].mock(return_value=mock_201)
+
+    # Would fail EventData's timestamp validation
+    event = {"type": "click", "timestamp": "not-a-timestamp"}
+    client.ingest_event(event, validate=False)
+
+    assert json.loads(route.calls.last.request.content) == event
+
+
+def test_ingest_event_empty_success_body(client, respx_mock):
+    """Test a bodiless 2xx acknowledgement is treated as success without decoding."""
+    respx_mock["ingest"].mock(return_value=httpx.Response(204))
+
+    response = client.ingest_event({"type": "click"})
+
+    assert (response.success, response.eventId) == (True, None)